@@ -0,0 +1,41 @@
+"""Per-tenant ID counters
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+
+Adds tenant_id_counters, used to allocate the scoped `id` of AccountScoped
+tables with a single atomic UPDATE instead of SELECT MAX(id) + 1.
+
+Counter rows are created lazily on the first insert for a tenant and seeded
+from the rows that already exist, so no data backfill is needed here.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create tenant_id_counters table."""
+    op.create_table(
+        "tenant_id_counters",
+        sa.Column("table_name", sa.String(64), nullable=False),
+        sa.Column("account_id", sa.Integer(), nullable=False),
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("last_id", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("table_name", "account_id", "company_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop tenant_id_counters table."""
+    op.drop_table("tenant_id_counters")
@@ -0,0 +1,44 @@
+"""Covering index for refresh token lookups
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+
+Replaces ix_refresh_tokens_hash, which duplicated the unique constraint on
+token_hash, with a composite index that also carries the columns read by the
+refresh flow. InnoDB secondary indexes include the primary key, so the lookup
+never touches the clustered index.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the token_hash index with a covering index."""
+    op.drop_index("ix_refresh_tokens_hash", table_name="refresh_tokens")
+    op.create_index(
+        "ix_refresh_tokens_hash",
+        "refresh_tokens",
+        [
+            "token_hash",
+            "expires_at",
+            "revoked_at",
+            "user_account_id",
+            "user_company_id",
+            "user_id",
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Restore the single-column token_hash index."""
+    op.drop_index("ix_refresh_tokens_hash", table_name="refresh_tokens")
+    op.create_index("ix_refresh_tokens_hash", "refresh_tokens", ["token_hash"])
@@ -0,0 +1,53 @@
+"""Indexes for the paginated property and unit list queries
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+
+Adds ix_properties_list, which matches the property list filter and its
+ORDER BY created_at, and ix_units_leasable, which matches the leasable-unit
+filter and its ORDER BY (property_id, unit_code). Both let the paged query
+read rows in index order instead of sorting every match. ix_units_is_leaf is
+a prefix of ix_units_leasable and is dropped.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the list query indexes."""
+    op.create_index(
+        "ix_properties_list",
+        "properties",
+        ["account_id", "company_id", "is_deleted", "created_at"],
+    )
+    op.drop_index("ix_units_is_leaf", table_name="units")
+    op.create_index(
+        "ix_units_leasable",
+        "units",
+        [
+            "account_id",
+            "company_id",
+            "is_leaf",
+            "status",
+            "property_id",
+            "unit_code",
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Drop the list query indexes."""
+    op.drop_index("ix_units_leasable", table_name="units")
+    op.create_index(
+        "ix_units_is_leaf", "units", ["account_id", "company_id", "is_leaf"]
+    )
+    op.drop_index("ix_properties_list", table_name="properties")
@@ -0,0 +1,47 @@
+"""Backfill property unit counts
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+
+properties.total_units_count and active_units_count are now maintained by
+the unit CRUD functions and read instead of counting units. Existing rows
+still hold the column default, so recompute them once from the units table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Recompute unit counts for every property."""
+    op.execute("""
+        UPDATE properties p
+        LEFT JOIN (
+            SELECT
+                account_id,
+                company_id,
+                property_id,
+                COUNT(*) AS total_units,
+                SUM(status <> 'inactive') AS active_units
+            FROM units
+            GROUP BY account_id, company_id, property_id
+        ) u
+            ON u.account_id = p.account_id
+            AND u.company_id = p.company_id
+            AND u.property_id = p.id
+        SET
+            p.total_units_count = COALESCE(u.total_units, 0),
+            p.active_units_count = COALESCE(u.active_units, 0)
+    """)
+
+
+def downgrade() -> None:
+    """Nothing to undo; the counts are left as computed."""
@@ -0,0 +1,43 @@
+"""Store coordinates and unit area as DOUBLE
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16
+
+properties.latitude/longitude (DECIMAL(10, 7)) and units.area_sqm
+(DECIMAL(10, 2)) are read as Python floats everywhere. DECIMAL columns
+decode to Decimal first, one object per value on every list row, so they
+become DOUBLE, which the driver returns as float directly. DOUBLE keeps
+about 15 significant digits, which covers the 7 decimal places used for
+coordinates. Nullability is left as it is in the database.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert the DECIMAL columns to DOUBLE."""
+    op.execute("""
+        ALTER TABLE properties
+        MODIFY COLUMN latitude DOUBLE NULL,
+        MODIFY COLUMN longitude DOUBLE NULL
+    """)
+    op.execute("ALTER TABLE units MODIFY COLUMN area_sqm DOUBLE NULL")
+
+
+def downgrade() -> None:
+    """Restore the DECIMAL columns."""
+    op.execute("""
+        ALTER TABLE properties
+        MODIFY COLUMN latitude DECIMAL(10, 7) NULL,
+        MODIFY COLUMN longitude DECIMAL(10, 7) NULL
+    """)
+    op.execute("ALTER TABLE units MODIFY COLUMN area_sqm DECIMAL(10, 2) NULL")
@@ -0,0 +1,38 @@
+"""FULLTEXT index for property search
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16
+
+The property list search matched '%term%' with LIKE on property_name,
+property_code and address_line_1, which no B-tree index can serve. An ngram
+FULLTEXT index over the three columns lets the search run as
+MATCH ... AGAINST instead of scanning the table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the ngram FULLTEXT search index."""
+    # The default stopword list holds single letters such as "a", and the ngram
+    # parser drops every ngram containing one; build the index without it
+    op.execute("SET SESSION innodb_ft_enable_stopword = OFF")
+    op.execute("""
+        CREATE FULLTEXT INDEX ix_properties_search
+        ON properties (property_name, property_code, address_line_1)
+        WITH PARSER ngram
+    """)
+
+
+def downgrade() -> None:
+    """Drop the FULLTEXT search index."""
+    op.drop_index("ix_properties_search", table_name="properties")
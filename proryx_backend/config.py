@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     log_format: str = Field(default="json", alias="LOG_FORMAT")
     log_max_bytes: int = Field(default=50 * 1024 * 1024, alias="LOG_MAX_BYTES")  # 50MB
     log_backup_count: int = Field(default=5, alias="LOG_BACKUP_COUNT")
+    log_binary_requests_path: str = Field(
+        default="logs/requests.bin", alias="LOG_BINARY_REQUESTS_PATH"
+    )
 
     # Database
     database_url: str = Field(
@@ -40,6 +43,17 @@ class Settings(BaseSettings):
     database_ssl_verify_identity: bool = Field(
         default=True, alias="DATABASE_SSL_VERIFY_IDENTITY"
     )
+    db_pool_size: int = Field(default=20, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=40, alias="DB_MAX_OVERFLOW")
+    # Connections all workers on a host may hold together; the per-worker pool
+    # is capped to a share of it. Keep it under MySQL's max_connections (151)
+    db_max_connections: int = Field(default=120, alias="DB_MAX_CONNECTIONS")
+    # Pin DB sessions to UTC and write timestamps in UTC. Rows already written
+    # by NOW() hold the server's local time, so only enable this on a server
+    # that already runs UTC or after converting those rows (CONVERT_TZ)
+    db_utc_time_zone: bool = Field(default=False, alias="DB_UTC_TIME_ZONE")
+    # Engine-wide LRU of compiled SQL; SQLAlchemy's default is 500 entries
+    db_query_cache_size: int = Field(default=1200, alias="DB_QUERY_CACHE_SIZE")
 
     # API Configuration
     api_prefix: str = Field(default="/api", alias="API_PREFIX")
@@ -72,6 +86,7 @@ class Settings(BaseSettings):
     # Security
     max_login_attempts: int = Field(default=5, alias="MAX_LOGIN_ATTEMPTS")
     lockout_duration_minutes: int = Field(default=30, alias="LOCKOUT_DURATION_MINUTES")
+    password_hash_target_ms: int = Field(default=300, alias="PASSWORD_HASH_TARGET_MS")
 
     # Rate Limiting
     rate_limit_enabled: bool = Field(default=True, alias="RATE_LIMIT_ENABLED")
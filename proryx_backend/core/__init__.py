@@ -13,6 +13,7 @@ from .exceptions import (
     ValidationError,
 )
 from .pagination import PaginatedResults, calculate_offset, validate_pagination_params
+from .responses import OrjsonResponse
 
 __all__ = [
     "BaseCRUD",
@@ -28,4 +29,5 @@ __all__ = [
     "PaginatedResults",
     "validate_pagination_params",
     "calculate_offset",
+    "OrjsonResponse",
 ]
@@ -0,0 +1,150 @@
+"""
+Compact binary request logging.
+Packs the fixed LoggingMiddleware records into structs; inflate offline to JSON.
+
+Usage:
+    python -m proryx_backend.core.logging.binary_logger logs/requests.bin
+"""
+
+import io
+import logging
+import os
+import struct
+import sys
+from collections.abc import Iterator
+
+import orjson
+
+# Record layouts (little-endian). The static message text and field names live
+# in _RECORD_TYPES below and are only reattached when the file is inflated.
+# Every record starts with a header; the transaction ID is length-prefixed
+# because RequestIdMiddleware passes through whatever the client sent.
+# kind, ts_ns, txn_len (txn_id bytes follow)
+REQUEST_HEADER = struct.Struct("<BQH")
+# method_id, path_len (path bytes follow)
+REQUEST_STARTED = struct.Struct("<BH")
+# status, dur_us
+REQUEST_COMPLETED = struct.Struct("<HI")
+
+_KIND_STARTED = 1
+_KIND_COMPLETED = 2
+_KIND_FAILED = 3
+
+_RECORD_TYPES = {
+    "Request started": _KIND_STARTED,
+    "Request completed": _KIND_COMPLETED,
+    "Request failed": _KIND_FAILED,
+}
+_MESSAGES = {kind: message for message, kind in _RECORD_TYPES.items()}
+
+_METHODS = ("OTHER", "GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS")
+_METHOD_IDS = {method: i for i, method in enumerate(_METHODS)}
+
+_MAX_TXN_ID_LEN = 0xFFFF
+_MAX_PATH_LEN = 0xFFFF
+_MAX_DUR_US = 0xFFFFFFFF
+
+
+class BinaryRequestLogHandler(logging.Handler):
+    """Logging handler that appends request records as packed structs.
+
+    Only the fixed request log sites are encoded; any other record sent to
+    this handler is dropped.
+    """
+
+    def __init__(self, log_file_path: str = "logs/requests.bin"):
+        super().__init__()
+        os.makedirs(os.path.dirname(log_file_path) or ".", exist_ok=True)
+        fd = os.open(log_file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._stream = io.BufferedWriter(io.FileIO(fd, "wb"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Pack the record and append it to the buffered file."""
+        kind = _RECORD_TYPES.get(record.msg)
+        if kind is None:
+            return
+
+        try:
+            txn_id = getattr(record, "transaction_id", "").encode("utf-8")
+            txn_id = txn_id[:_MAX_TXN_ID_LEN]
+            header = REQUEST_HEADER.pack(
+                kind, int(record.created * 1_000_000_000), len(txn_id)
+            )
+
+            if kind == _KIND_STARTED:
+                path = record.path.encode("utf-8")[:_MAX_PATH_LEN]
+                body = (
+                    REQUEST_STARTED.pack(_METHOD_IDS.get(record.method, 0), len(path))
+                    + path
+                )
+            else:
+                body = REQUEST_COMPLETED.pack(
+                    getattr(record, "status_code", 500),
+                    min(int(record.duration_ms * 1000), _MAX_DUR_US),
+                )
+            data = header + txn_id + body
+
+            with self.lock:
+                self._stream.write(data)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Flush buffered records to the file."""
+        with self.lock:
+            if not self._stream.closed:
+                self._stream.flush()
+
+    def close(self) -> None:
+        """Flush and close the underlying file."""
+        with self.lock:
+            if not self._stream.closed:
+                self._stream.close()
+        super().close()
+
+
+def inflate(log_file_path: str) -> Iterator[dict]:
+    """Decode a binary request log back into dict records."""
+    with open(log_file_path, "rb") as f:
+        data = f.read()
+
+    offset = 0
+    while offset < len(data):
+        kind, ts_ns, txn_len = REQUEST_HEADER.unpack_from(data, offset)
+        offset += REQUEST_HEADER.size
+        txn_id = data[offset : offset + txn_len].decode("utf-8", "replace")
+        offset += txn_len
+
+        if kind == _KIND_STARTED:
+            method_id, path_len = REQUEST_STARTED.unpack_from(data, offset)
+            offset += REQUEST_STARTED.size
+            path = data[offset : offset + path_len].decode("utf-8", "replace")
+            offset += path_len
+            fields = {"method": _METHODS[method_id], "path": path}
+        else:
+            status, dur_us = REQUEST_COMPLETED.unpack_from(data, offset)
+            offset += REQUEST_COMPLETED.size
+            fields = {"status_code": status, "duration_ms": dur_us / 1000}
+
+        yield {
+            "timestamp_ns": ts_ns,
+            "message": _MESSAGES[kind],
+            "transaction_id": txn_id,
+            **fields,
+        }
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Print each record of the given binary log files as a JSON line."""
+    paths = argv if argv is not None else sys.argv[1:]
+    if not paths:
+        sys.exit("usage: python -m proryx_backend.core.logging.binary_logger FILE ...")
+
+    out = sys.stdout.buffer
+    for path in paths:
+        for entry in inflate(path):
+            out.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+
+
+if __name__ == "__main__":
+    main()
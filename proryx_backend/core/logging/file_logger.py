@@ -50,7 +50,8 @@ class FileLogger:
         else:
             formatter = logging.Formatter(
                 "%(asctime)s | %(levelname)s | %(transaction_id)s | "
-                "%(filename)s:%(lineno)d | %(message)s"
+                "%(filename)s:%(lineno)d | %(message)s",
+                defaults={"transaction_id": "-"},
             )
 
         file_handler.setFormatter(formatter)
@@ -154,6 +155,7 @@ def configure_external_loggers(queue_handler: QueueHandler) -> None:
         "urllib3",
         "sqlalchemy",
         "uvicorn",
+        "uvicorn.access",
         "fastapi",
         "asyncmy",
         "aiohttp",
@@ -165,7 +167,7 @@ def configure_external_loggers(queue_handler: QueueHandler) -> None:
         ext_logger.addHandler(queue_handler)
         ext_logger.propagate = False
 
-        if logger_name in ["urllib3"]:
+        if logger_name in ["urllib3", "uvicorn.access"]:
             ext_logger.setLevel(logging.WARNING)
         elif logger_name == "sqlalchemy":
             ext_logger.setLevel(logging.WARNING)
@@ -6,6 +6,7 @@ Provides setup functions and logger management.
 import logging
 import os
 
+from .binary_logger import BinaryRequestLogHandler
 from .file_logger import FileLogger, configure_external_loggers, setup_file_logging
 from .middleware import TransactionIdFilter, setup_logging_middleware
 from .structured_logger import setup_structured_logging
@@ -17,6 +18,7 @@ class LoggingConfig:
     def __init__(self):
         self.file_logger: FileLogger | None = None
         self.transaction_filter: TransactionIdFilter | None = None
+        self.binary_handler: BinaryRequestLogHandler | None = None
         self._is_configured = False
 
     def setup(
@@ -27,6 +29,7 @@ class LoggingConfig:
         use_json_format: bool = True,
         max_bytes: int = 50 * 1024 * 1024,
         backup_count: int = 5,
+        binary_request_log_path: str | None = None,
     ) -> logging.Logger:
         """
         Set up comprehensive logging configuration.
@@ -38,6 +41,8 @@ class LoggingConfig:
             use_json_format: Whether to use JSON formatting
             max_bytes: Maximum file size before rotation
             backup_count: Number of backup files to keep
+            binary_request_log_path: If set, request logs are written here as
+                packed binary records instead of going through the JSON handlers
 
         Returns:
             Configured main logger instance
@@ -58,14 +63,19 @@ class LoggingConfig:
             )
 
             if self.file_logger:
+                # Records are formatted on the listener thread, so the
+                # transaction ID has to be captured when they are queued
                 queue_handler = self.file_logger.get_queue_handler()
                 queue_handler.addFilter(self.transaction_filter)
                 configure_external_loggers(queue_handler)
         else:
-            logger = setup_structured_logging(log_level)
+            setup_structured_logging(log_level)
 
-            for handler in logger.handlers:
-                handler.addFilter(self.transaction_filter)
+        if binary_request_log_path:
+            self.binary_handler = BinaryRequestLogHandler(binary_request_log_path)
+            request_logger = get_logger("requests")
+            request_logger.addHandler(self.binary_handler)
+            request_logger.propagate = False
 
         main_logger = get_logger()
         self._is_configured = True
@@ -76,6 +86,10 @@ class LoggingConfig:
         """Shutdown logging gracefully."""
         if self.file_logger:
             self.file_logger.stop()
+        if self.binary_handler:
+            get_logger("requests").removeHandler(self.binary_handler)
+            self.binary_handler.close()
+            self.binary_handler = None
         self._is_configured = False
 
 
@@ -88,6 +102,7 @@ def setup_logging(
     log_level: str | None = None,
     log_file_path: str | None = None,
     use_json_format: bool | None = None,
+    binary_request_log_path: str | None = None,
 ) -> logging.Logger:
     """
     Set up logging with environment variable support.
@@ -97,6 +112,7 @@ def setup_logging(
         log_level: Logging level (env: LOG_LEVEL)
         log_file_path: Path to log file (env: LOG_FILE_PATH)
         use_json_format: Whether to use JSON format (env: LOG_FORMAT=json)
+        binary_request_log_path: Binary request log file; disabled when None
 
     Returns:
         Configured main logger instance
@@ -119,6 +135,7 @@ def setup_logging(
         log_level=log_level,
         log_file_path=log_file_path,
         use_json_format=use_json_format,
+        binary_request_log_path=binary_request_log_path,
     )
 
 
@@ -6,12 +6,10 @@ Provides transaction ID generation and request/response logging.
 import logging
 import time
 import uuid
-from collections.abc import Callable
 from contextvars import ContextVar
 
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Context variable for transaction ID
 _transaction_id: ContextVar[str | None] = ContextVar("transaction_id", default=None)
@@ -36,97 +34,151 @@ def set_transaction_id(txn_id: str) -> None:
     _transaction_id.set(txn_id)
 
 
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds (2 decimal places) elapsed since a perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) // 10_000 / 100
+
+
+def _get_header(headers: dict[bytes, bytes], name: bytes) -> str | None:
+    """Look up a header in a dict built from raw ASGI (lowercase bytes) headers."""
+    value = headers.get(name)
+    return value.decode("latin-1") if value is not None else None
+
+
+def _bind_transaction_id(scope: Scope, txn_id: str) -> None:
+    """Set the transaction ID for the current context and the request state.
+
+    request.state.transaction_id does not depend on ContextVar propagation into
+    threadpool-run sync handlers.
+    """
+    set_transaction_id(txn_id)
+    state = scope.setdefault("state", {})
+    state["transaction_id"] = txn_id
+
+
 class TransactionIdFilter(logging.Filter):
-    """Logging filter that adds transaction ID to log records."""
+    """Logging filter that stamps the current transaction ID onto log records.
+
+    Only needed where records are formatted outside the request's context
+    (behind a QueueHandler). Records that already carry a transaction_id,
+    such as the request logs written by LoggingMiddleware, are left untouched.
+    """
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Add transaction ID to the log record."""
-        record.transaction_id = get_transaction_id()
+        if "transaction_id" not in record.__dict__:
+            record.transaction_id = _transaction_id.get() or "-"
         return True
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """FastAPI middleware for request/response logging with transaction tracking."""
+class LoggingMiddleware:
+    """ASGI middleware for request/response logging with transaction tracking.
+
+    Written as plain ASGI rather than BaseHTTPMiddleware so response bodies are
+    passed straight through instead of being streamed via an anyio memory
+    stream and an extra task group per request.
+    """
 
-    def __init__(self, app, logger: logging.Logger | None = None):
-        super().__init__(app)
+    def __init__(self, app: ASGIApp, logger: logging.Logger | None = None):
+        self.app = app
         self.logger = logger or logging.getLogger("proryx_backend.requests")
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request with logging and transaction tracking."""
-        txn_id = generate_transaction_id()
-        set_transaction_id(txn_id)
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Reuse the ID bound by an outer RequestIdMiddleware, if any
+        txn_id = scope.get("state", {}).get("transaction_id")
+        if txn_id is None:
+            txn_id = generate_transaction_id()
+            _bind_transaction_id(scope, txn_id)
 
-        start_time = time.time()
-        client_ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
+        start_ns = time.perf_counter_ns()
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        headers = dict(scope["headers"])
 
         self.logger.info(
             "Request started",
             extra={
                 "transaction_id": txn_id,
-                "method": request.method,
-                "url": str(request.url),
-                "path": request.url.path,
+                "method": scope["method"],
+                "url": str(URL(scope=scope)),
+                "path": scope["path"],
                 "client_ip": client_ip,
-                "user_agent": user_agent,
-                "content_type": request.headers.get("content-type"),
-                "content_length": request.headers.get("content-length"),
+                "user_agent": _get_header(headers, b"user-agent") or "unknown",
+                "content_type": _get_header(headers, b"content-type"),
+                "content_length": _get_header(headers, b"content-length"),
             },
         )
 
-        try:
-            response = await call_next(request)
-            duration = time.time() - start_time
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = dict(message.get("headers", ()))
+
+                self.logger.info(
+                    "Request completed",
+                    extra={
+                        "transaction_id": txn_id,
+                        "status_code": message["status"],
+                        "duration_ms": _elapsed_ms(start_ns),
+                        "response_size": _get_header(
+                            response_headers, b"content-length"
+                        ),
+                        "content_type": _get_header(response_headers, b"content-type"),
+                    },
+                )
+            await send(message)
 
-            self.logger.info(
-                "Request completed",
-                extra={
-                    "transaction_id": txn_id,
-                    "status_code": response.status_code,
-                    "duration_ms": round(duration * 1000, 2),
-                    "response_size": response.headers.get("content-length"),
-                    "content_type": response.headers.get("content-type"),
-                },
-            )
-
-            return response
+        try:
+            await self.app(scope, receive, send_wrapper)
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration_ms = _elapsed_ms(start_ns)
 
             self.logger.error(
                 "Request failed",
                 extra={
                     "transaction_id": txn_id,
-                    "duration_ms": round(duration * 1000, 2),
+                    "duration_ms": duration_ms,
                     "error": str(e),
                     "error_type": type(e).__name__,
                 },
                 exc_info=True,
             )
 
-            return JSONResponse(
-                status_code=500,
-                content={"detail": "Internal server error", "transaction_id": txn_id},
-            )
+            # The app's Exception handler (in Starlette's outermost
+            # ServerErrorMiddleware) builds the standard 500 response
+            raise
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    """Lightweight middleware that only sets transaction ID without detailed logging."""
+class RequestIdMiddleware:
+    """Lightweight ASGI middleware that only sets transaction ID without detailed logging."""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Set transaction ID for the request context."""
-        txn_id = request.headers.get("x-transaction-id")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        txn_id = _get_header(dict(scope["headers"]), b"x-transaction-id")
         if not txn_id:
             txn_id = generate_transaction_id()
 
-        set_transaction_id(txn_id)
+        _bind_transaction_id(scope, txn_id)
+        txn_header = (b"x-transaction-id", txn_id.encode("latin-1"))
 
-        response = await call_next(request)
-        response.headers["x-transaction-id"] = txn_id
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), txn_header]
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
 
 
 def setup_logging_middleware() -> TransactionIdFilter:
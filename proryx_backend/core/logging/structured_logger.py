@@ -9,17 +9,33 @@ import traceback
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 try:
+    from pythonjsonlogger.core import merge_record_extra
     from pythonjsonlogger.json import JsonFormatter
 
     BaseFormatter = JsonFormatter
 except ImportError:
-    from pythonjsonlogger.jsonlogger import JsonFormatter
+    from pythonjsonlogger.jsonlogger import JsonFormatter, merge_record_extra
 
     BaseFormatter = JsonFormatter
 
-# Import get_transaction_id lazily to avoid circular import
-get_txn_id = None
+from .middleware import _transaction_id
+
+# orjson options: allow non-string dict keys, render UTC datetimes with "Z"
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+# Service metadata shared by every record (never mutated)
+_SERVICE = {
+    "name": "proryx-backend",
+    "version": "0.1.0",
+}
+
+
+def _orjson_default(obj: Any) -> str:
+    """Fallback serializer for types orjson doesn't handle natively."""
+    return str(obj)
 
 
 class StructuredFormatter(BaseFormatter):
@@ -31,22 +47,27 @@ class StructuredFormatter(BaseFormatter):
         record: logging.LogRecord,
         message_dict: dict[str, Any],
     ) -> None:
-        """Add custom fields to every log record."""
-        super().add_fields(log_record, record, message_dict)
+        """Build the log record from a fixed set of fields plus any extras.
 
+        Fields are written directly instead of letting the base class copy the
+        format fields and then removing unwanted ones again.
+        """
         # Add timestamp in ISO format
         log_record["timestamp"] = datetime.now().astimezone().isoformat()
+        log_record["level"] = record.levelname
 
-        # Add transaction ID from the record (set by middleware)
-        global get_txn_id
-        if get_txn_id is None:
-            from proryx_backend.core.logging.middleware import (
-                get_transaction_id as get_txn_id,
-            )
-        log_record["transaction_id"] = getattr(record, "transaction_id", get_txn_id())
+        # Add transaction ID from the record (request logger adapter or queue
+        # filter), falling back to the current context when formatted inline
+        log_record["transaction_id"] = (
+            getattr(record, "transaction_id", None) or _transaction_id.get() or "-"
+        )
+        log_record["message"] = record.message
+
+        # Dict messages and `extra=` attributes
+        log_record.update(message_dict)
+        merge_record_extra(record, log_record, reserved=self._skip_fields)
 
         # Add standard fields
-        log_record["level"] = record.levelname
         log_record["logger_name"] = record.name
         log_record["module"] = record.module
         log_record["function"] = record.funcName
@@ -54,10 +75,7 @@ class StructuredFormatter(BaseFormatter):
         log_record["filename"] = record.filename
 
         # Add service metadata
-        log_record["service"] = {
-            "name": "proryx-backend",
-            "version": "0.1.0",
-        }
+        log_record["service"] = _SERVICE
 
         # Handle exceptions with full stack trace
         if record.exc_info:
@@ -67,9 +85,11 @@ class StructuredFormatter(BaseFormatter):
                 "stacktrace": traceback.format_exception(*record.exc_info),
             }
 
-        # Remove duplicate or internal fields
-        for field in ["msg", "args", "created", "msecs", "relativeCreated", "pathname"]:
-            log_record.pop(field, None)
+    def jsonify_log_record(self, log_record: dict[str, Any]) -> str:
+        """Serialize the log record with orjson instead of the stdlib json module."""
+        return orjson.dumps(
+            log_record, default=_orjson_default, option=_ORJSON_OPTIONS
+        ).decode()
 
 
 def setup_structured_logging(log_level: str = "INFO") -> logging.Logger:
@@ -102,6 +122,7 @@ def setup_structured_logging(log_level: str = "INFO") -> logging.Logger:
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
     logging.getLogger("uvicorn").setLevel(logging.INFO)
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("fastapi").setLevel(logging.INFO)
 
     return logger
@@ -41,11 +41,12 @@ class PaginatedResults(BaseModel, Generic[T]):
         Returns:
             PaginatedResults instance with calculated metadata
         """
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+        total_pages = -(-total // page_size)
         has_next = page < total_pages
         has_previous = page > 1
 
-        return cls(
+        # Items are already validated upstream; skip re-validating the page
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
@@ -0,0 +1,20 @@
+"""
+JSON response class for responses built outside FastAPI's response_model path.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSONResponse that encodes with orjson instead of the stdlib json module.
+
+    Meant for hand-built responses (exception handlers, middleware). Routes
+    should keep returning their response_model, which FastAPI already
+    serializes to JSON in pydantic-core.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
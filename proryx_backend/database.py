@@ -4,31 +4,43 @@ Database configuration for ProRyx Property Management System.
 Implements two-level multi-tenancy with account_id + company_id.
 """
 
+import asyncio
+import functools
 import logging
+import os
+import time
+import uuid
 from datetime import datetime
 from typing import Annotated
 
 from fastapi import Depends, Request
 from sqlalchemy import (
     UUID,
+    BigInteger,
+    Connection,
     DateTime,
     ForeignKey,
     Integer,
+    String,
     UniqueConstraint,
+    and_,
     event,
     text,
 )
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import (
+    DeclarativeBase,
     Mapped,
-    declarative_base,
+    Session,
     declared_attr,
     mapped_column,
+    with_loader_criteria,
 )
 from sqlalchemy.sql import func
 
 from .config import settings
 from .core.database_types import UUID as UUID_DB
+from .core.utils import utc_now
 
 logger = logging.getLogger(__name__)
 
@@ -41,38 +53,136 @@ if settings.database_url.startswith("mysql+asyncmy"):
             "ssl_verify_cert": settings.database_ssl_verify_cert,
             "ssl_verify_identity": settings.database_ssl_verify_identity,
         },
+        "autocommit": False,
     }
+    if settings.db_utc_time_zone:
+        # NOW() and the Python-side timestamps below must agree on UTC
+        connect_args["init_command"] = "SET time_zone = '+00:00'"
+
+# Every worker process has its own pool. uvicorn takes its worker count from
+# WEB_CONCURRENCY, so each worker caps pool + overflow at its share of
+# db_max_connections instead of multiplying the configured sizes by workers.
+_WORKER_COUNT = max(1, int(os.environ.get("WEB_CONCURRENCY") or 1))
+_WORKER_CONNECTIONS = max(1, settings.db_max_connections // _WORKER_COUNT)
+DB_POOL_SIZE = min(settings.db_pool_size, _WORKER_CONNECTIONS)
+DB_MAX_OVERFLOW = min(settings.db_max_overflow, _WORKER_CONNECTIONS - DB_POOL_SIZE)
 
 engine = create_async_engine(
     settings.database_url,
     echo=settings.app_debug,
     future=True,
     connect_args=connect_args,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    # Reuse the most recently returned connection so hot connections stay hot
+    # and idle ones can age out
+    pool_use_lifo=True,
     pool_pre_ping=True,
     pool_recycle=3600,
+    pool_reset_on_return="rollback",
+    # Sized so every statement shape across the modules stays cached; one
+    # bounded engine-wide LRU rather than unbounded per-module dicts
+    query_cache_size=settings.db_query_cache_size,
 )
 
+
+async def warm_db_pool(size: int = DB_POOL_SIZE) -> None:
+    """Open `size` pooled connections up front so first requests don't pay for it.
+
+    The connections are checked out concurrently and returned straight away, so
+    they stay in the pool. If some fail to open, the ones that did are still
+    returned before the first error is raised.
+    """
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    await asyncio.gather(
+        *(conn.close() for conn in results if not isinstance(conn, BaseException))
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
-# Base class
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base class for all models."""
+
+
+# Random bytes for row UUIDs are read from os.urandom() in batches so bulk
+# inserts don't pay for one syscall per row.
+_UUID_POOL_SIZE = 256
+_UUID_RAND_BYTES = 10  # covers the 74 random bits of a version 7 UUID
+_uuid_pool: list[int] = []
+
+# Never let a forked worker reuse the parent's pre-generated entropy
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def new_uuid() -> uuid.UUID:
+    """Return a time-ordered (version 7) UUID for a new row.
+
+    The leading 48 bits are the Unix time in milliseconds, so new UUIDs (and
+    their CHAR(36) text form) sort after older ones and inserts land at the end
+    of the uuid indexes instead of on random pages.
+    """
+    if not _uuid_pool:
+        entropy = os.urandom(_UUID_RAND_BYTES * _UUID_POOL_SIZE)
+        _uuid_pool.extend(
+            int.from_bytes(entropy[i : i + _UUID_RAND_BYTES])
+            for i in range(0, len(entropy), _UUID_RAND_BYTES)
+        )
+    rand = _uuid_pool.pop()
+    return uuid.UUID(
+        int=(time.time_ns() // 1_000_000) << 80
+        | 0x7 << 76  # version
+        | (rand >> 68 & 0xFFF) << 64  # rand_a
+        | 0b10 << 62  # RFC 4122 variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    )
+
+
+def db_timestamp() -> datetime:
+    """Current time as a DATETIME column stores and returns it.
+
+    The columns are plain DATETIME: whole seconds, no time zone. Writing the
+    value in that form keeps the in-memory attribute equal to what a later
+    SELECT reads back. The clock is UTC when DB_UTC_TIME_ZONE pins sessions
+    to UTC; otherwise it is local time, as NOW() writes it on a database
+    server in the app host's time zone.
+    """
+    if settings.db_utc_time_zone:
+        return utc_now().replace(microsecond=0, tzinfo=None)
+    return datetime.now().replace(microsecond=0)
 
 
 class TimestampMixin:
-    """Mixin to add created and updated timestamps to models."""
+    """Mixin to add created and updated timestamps to models.
+
+    Timestamps are set in Python as well as by the server default: MySQL has
+    no INSERT/UPDATE ... RETURNING, so SQL-side values would leave the
+    attributes expired after a flush and cost a SELECT to read them back.
+    Both use the same clock; see db_timestamp().
+    """
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True),
+        nullable=False,
+        default=db_timestamp,
+        server_default=func.now(),
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
+        default=db_timestamp,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=db_timestamp,
     )
 
 
@@ -116,7 +226,9 @@ class AccountScoped:
     )
 
     # UUID for external references (unique within account+company)
-    uuid: Mapped[UUID] = mapped_column(UUID_DB(), nullable=False, index=True)
+    uuid: Mapped[UUID] = mapped_column(
+        UUID_DB(), default=new_uuid, nullable=False, index=True
+    )
 
     @declared_attr
     def __table_args__(cls):
@@ -131,6 +243,69 @@ class AccountScoped:
         )
 
 
+class TenantIdCounter(Base):
+    """Per-tenant ID counter for AccountScoped tables.
+
+    Stores the last ID handed out for each (table, account, company) so new
+    rows get their scoped ID from one atomic UPDATE instead of a MAX(id) scan.
+    """
+
+    __tablename__ = "tenant_id_counters"
+
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    account_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    company_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    last_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+# LAST_INSERT_ID(expr) makes MySQL report the new value as the statement's
+# insert id, so the allocated ID comes back without a second SELECT.
+_BUMP_TENANT_ID = text(
+    "UPDATE tenant_id_counters SET last_id = LAST_INSERT_ID(last_id + 1) "
+    "WHERE table_name = :table_name "
+    "AND account_id = :account_id AND company_id = :company_id"
+)
+
+_SEED_TENANT_ID = (
+    "INSERT INTO tenant_id_counters (table_name, account_id, company_id, last_id) "
+    "SELECT :table_name, :account_id, :company_id, "
+    "LAST_INSERT_ID(COALESCE(MAX(id), 0) + 1) FROM {table_name} "
+    "WHERE account_id = :account_id AND company_id = :company_id "
+    "ON DUPLICATE KEY UPDATE last_id = LAST_INSERT_ID(last_id + 1)"
+)
+
+
+def allocate_tenant_id(
+    connection: Connection, table_name: str, account_id: int, company_id: int
+) -> int:
+    """Atomically allocate the next ID for a table within an account+company scope.
+
+    The counter row is created on first use, seeded from any rows that already
+    exist for the tenant.
+
+    Args:
+        connection: Sync database connection
+        table_name: Name of the AccountScoped table
+        account_id: Account ID
+        company_id: Company ID
+
+    Returns:
+        Newly allocated ID for the tenant
+    """
+    params = {
+        "table_name": table_name,
+        "account_id": account_id,
+        "company_id": company_id,
+    }
+
+    result = connection.execute(_BUMP_TENANT_ID, params)
+    if result.rowcount == 0:
+        result = connection.execute(
+            text(_SEED_TENANT_ID.format(table_name=table_name)), params
+        )
+    return result.lastrowid
+
+
 async def get_db() -> AsyncSession:
     """Dependency to get database session."""
     async with AsyncSessionLocal() as session:
@@ -143,7 +318,7 @@ async def get_db() -> AsyncSession:
 async def get_next_id_for_tenant(
     session: AsyncSession, model_class, account_id: int, company_id: int
 ) -> int:
-    """Get the next available ID for a table within an account+company scope.
+    """Allocate the next available ID for a table within an account+company scope.
 
     Args:
         session: Async database session
@@ -154,106 +329,68 @@ async def get_next_id_for_tenant(
     Returns:
         Next available ID for the tenant
     """
-    table_name = model_class.__tablename__
-
-    result = await session.execute(
-        text(
-            f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table_name} "
-            f"WHERE account_id = :account_id AND company_id = :company_id"
-        ),
-        {"account_id": account_id, "company_id": company_id},
+    connection = await session.connection()
+    return await connection.run_sync(
+        allocate_tenant_id, model_class.__tablename__, account_id, company_id
     )
-    return result.scalar()
 
 
 @event.listens_for(AccountScoped, "before_insert", propagate=True)
 def set_composite_key_fields(mapper, connection, target):
-    """Event listener to set composite key fields before insert."""
-    import uuid
-
-    # Generate UUID if not set
-    if not hasattr(target, "uuid") or target.uuid is None:
-        target.uuid = uuid.uuid4()
-
-    # Generate ID if not set
-    if (
-        target.id is None
-        and target.account_id is not None
-        and target.company_id is not None
-    ):
-        table_name = mapper.mapped_table.name
+    """Event listener to allocate the tenant-scoped ID before insert.
 
-        result = connection.execute(
-            text(
-                f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table_name} "
-                f"WHERE account_id = :account_id AND company_id = :company_id"
-            ),
-            {"account_id": target.account_id, "company_id": target.company_id},
-        )
-        next_id = result.scalar()
-        target.id = next_id
-
-
-class TenantFilteredSession:
-    """Wrapper to apply tenant filtering to queries."""
-
-    def __init__(self, session: AsyncSession, account_id: int, company_id: int):
-        self._session = session
-        self._account_id = account_id
-        self._company_id = company_id
-        self._session.info["account_id"] = account_id
-        self._session.info["company_id"] = company_id
-
-    async def execute(self, statement, params=None, **kwargs):
-        """Execute with automatic tenant filtering."""
-        from sqlalchemy.sql import Select
-
-        if isinstance(statement, Select) and self._account_id is not None:
-            org_scoped_models = []
-            for mapper in Base.registry.mappers:
-                if (
-                    hasattr(mapper.class_, "__mro__")
-                    and AccountScoped in mapper.class_.__mro__
-                ):
-                    org_scoped_models.append(mapper.class_)
-
-            from sqlalchemy.sql.util import find_tables
-
-            tables_in_query = set(find_tables(statement, include_aliases=True))
-
-            for model in org_scoped_models:
-                if hasattr(model, "__table__") and model.__table__ in tables_in_query:
-                    statement = statement.filter(
-                        model.account_id == self._account_id,
-                        model.company_id == self._company_id,
-                    )
-
-        return await self._session.execute(statement, params, **kwargs)
+    The UUID is filled in by the column default.
+    """
+    # Read loaded values straight from the instance dict; this skips the
+    # instrumented attribute descriptors and bails out first when id is set
+    state = target.__dict__
+    if state.get("id") is not None:
+        return
+
+    account_id = state.get("account_id")
+    company_id = state.get("company_id")
+    if account_id is None or company_id is None:
+        return
+
+    target.id = allocate_tenant_id(
+        connection, mapper.local_table.name, account_id, company_id
+    )
 
-    def add(self, instance):
-        return self._session.add(instance)
 
-    def add_all(self, instances):
-        return self._session.add_all(instances)
+@functools.lru_cache(maxsize=1024)
+def _tenant_criteria(account_id: int, company_id: int):
+    """Loader option restricting every AccountScoped entity to one tenant.
 
-    async def flush(self):
-        return await self._session.flush()
+    The lambda's closure values become bound parameters, so the compiled SQL is
+    cached once and shared across tenants; the option itself is built once per
+    tenant rather than once per query.
+    """
+    return with_loader_criteria(
+        AccountScoped,
+        lambda cls: and_(cls.account_id == account_id, cls.company_id == company_id),
+        include_aliases=True,
+    )
 
-    async def commit(self):
-        return await self._session.commit()
 
-    async def rollback(self):
-        return await self._session.rollback()
+@event.listens_for(Session, "do_orm_execute")
+def apply_tenant_filter(orm_execute_state):
+    """Restrict ORM SELECTs to the session's tenant.
 
-    async def close(self):
-        return await self._session.close()
+    Sessions handed out by get_tenant_db carry account_id/company_id in
+    session.info; every AccountScoped entity in their SELECTs (including
+    aliases and relationship loads) gets the tenant criteria attached.
+    """
+    if not orm_execute_state.is_select or orm_execute_state.is_column_load:
+        return
 
-    @property
-    def info(self):
-        return self._session.info
+    info = orm_execute_state.session.info
+    account_id = info.get("account_id")
+    if account_id is None:
+        return
 
-    def __getattr__(self, name):
-        return getattr(self._session, name)
+    orm_execute_state.statement = orm_execute_state.statement.options(
+        _tenant_criteria(account_id, info["company_id"])
+    )
 
 
 async def get_tenant_db(
@@ -273,10 +410,10 @@ async def get_tenant_db(
             detail="Tenant context not available. Please authenticate first.",
         )
 
-    account_id = request.state.account_id
-    company_id = request.state.company_id
+    session.info["account_id"] = request.state.account_id
+    session.info["company_id"] = request.state.company_id
 
-    return TenantFilteredSession(session, account_id, company_id)
+    return session
 
 
 # Type alias for dependency injection
@@ -4,14 +4,22 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from .config import settings
 from .core.exceptions import ProRyxException
-from .core.logging import RequestIdMiddleware, get_logger, setup_logging
+from .core.logging import (
+    LoggingMiddleware,
+    RequestIdMiddleware,
+    get_logger,
+    setup_logging,
+)
+from .core.responses import OrjsonResponse
+from .database import AsyncSessionLocal, warm_db_pool
 
 # Import routers
 from .modules.auth import router as auth_router
+from .modules.auth.crud import load_role_cache
+from .modules.auth.password_service import calibrate_bcrypt_rounds
 from .modules.property_management import (
     categories_router as unit_categories_router,
 )
@@ -42,9 +50,23 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
     logger.info("Starting ProRyx application...")
-    setup_logging()
+    # Outside debug, request logs go to the compact binary file
+    setup_logging(
+        binary_request_log_path=(
+            None if settings.app_debug else settings.log_binary_requests_path
+        )
+    )
     logger.info(f"Environment: {settings.app_env}")
     logger.info(f"Debug mode: {settings.app_debug}")
+    bcrypt_rounds = calibrate_bcrypt_rounds(settings.password_hash_target_ms)
+    logger.info(f"Password hashing: bcrypt rounds={bcrypt_rounds}")
+    try:
+        await warm_db_pool()
+        async with AsyncSessionLocal() as db:
+            await load_role_cache(db)
+    except Exception as e:
+        # Not fatal: connections and roles are created on first use instead
+        logger.warning(f"Could not warm database pool or preload roles: {e}")
     yield
     # Shutdown
     logger.info("Shutting down ProRyx application...")
@@ -70,6 +92,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request logging; runs inside RequestIdMiddleware so it logs the same
+# transaction ID that is returned in the x-transaction-id header
+app.add_middleware(LoggingMiddleware)
+
 # Request ID middleware for request tracing
 app.add_middleware(RequestIdMiddleware)
 
@@ -80,7 +106,7 @@ async def proryx_exception_handler(request: Request, exc: ProRyxException):
     """Handle ProRyx-specific exceptions."""
     # Get status code from exception or default to 400
     status_code = getattr(exc, "status_code", 400)
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=status_code,
         content={
             "success": False,
@@ -95,7 +121,7 @@ async def proryx_exception_handler(request: Request, exc: ProRyxException):
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unhandled exceptions."""
     logger.exception(f"Unhandled exception: {exc}")
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=500,
         content={
             "success": False,
@@ -138,11 +164,23 @@ app.include_router(document_types_router, prefix=API_PREFIX)
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
+    # Requests are logged by LoggingMiddleware, so uvicorn's access log is
+    # off. Multiple workers can't be combined with reload, so only outside debug.
+    # Workers read WEB_CONCURRENCY to size their share of the DB connections.
+    workers = None if settings.app_debug else os.cpu_count()
+    if workers:
+        os.environ["WEB_CONCURRENCY"] = str(workers)
     uvicorn.run(
         "proryx_backend.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        workers=workers,
         reload=settings.app_debug,
     )
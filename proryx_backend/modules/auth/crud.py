@@ -1,14 +1,17 @@
 """CRUD operations for authentication module."""
 
-from datetime import datetime, timezone
+import asyncio
+import time
+from datetime import datetime
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, load_only
 
+from ...core.utils import utc_now
 from .jwt_service import hash_refresh_token
 from .models import Account, Company, RefreshToken, Role, User
-from .password_service import hash_password
+from .password_service import hash_password_async
 
 # ----- Account CRUD -----
 
@@ -27,9 +30,7 @@ async def get_account_by_uuid(db: AsyncSession, uuid: str) -> Account | None:
 
 async def create_account(db: AsyncSession, name: str) -> Account:
     """Create a new account."""
-    import uuid
-
-    account = Account(uuid=str(uuid.uuid4()), name=name, is_active=True)
+    account = Account(name=name, is_active=True)
     db.add(account)
     await db.flush()
     return account
@@ -52,16 +53,13 @@ async def get_company_by_id(
 async def get_companies_by_account(db: AsyncSession, account_id: int) -> list[Company]:
     """Get all companies for an account."""
     result = await db.execute(select(Company).where(Company.account_id == account_id))
-    return list(result.scalars().all())
+    # AsyncSession.execute() already pre-buffers rows and .all() returns a list
+    return result.scalars().all()
 
 
 async def create_company(db: AsyncSession, name: str, account_id: int) -> Company:
     """Create a new company."""
-    import uuid
-
-    company = Company(
-        uuid=str(uuid.uuid4()), account_id=account_id, name=name, is_active=True
-    )
+    company = Company(account_id=account_id, name=name, is_active=True)
     db.add(company)
     await db.flush()
     return company
@@ -69,23 +67,85 @@ async def create_company(db: AsyncSession, name: str, account_id: int) -> Compan
 
 # ----- Role CRUD -----
 
+# Roles are a small, effectively static lookup table, so they are kept in
+# process. Cached instances are expunged from the loading session (detached).
+# Other workers may add roles, so the cache expires after
+# _ROLE_CACHE_TTL_SECONDS; until then a lookup that misses a fresh cache is
+# "not found" rather than a reload.
+_ROLE_CACHE_TTL_SECONDS = 300
+
+_roles_by_slug: dict[str, Role] = {}
+_roles_by_id: dict[int, Role] = {}
+_roles_loaded_at: float | None = None
+_role_cache_lock = asyncio.Lock()
+
+
+def _role_cache_is_fresh() -> bool:
+    """Whether the cache is loaded and younger than its TTL."""
+    return (
+        _roles_loaded_at is not None
+        and time.monotonic() - _roles_loaded_at < _ROLE_CACHE_TTL_SECONDS
+    )
+
+
+async def _reload_role_cache(db: AsyncSession) -> None:
+    """Read all roles into the cache; the caller holds the lock."""
+    global _roles_loaded_at
+    result = await db.execute(select(Role))
+    roles = list(result.scalars().all())
+    for role in roles:
+        db.expunge(role)
+
+    _roles_by_slug.clear()
+    _roles_by_slug.update({role.slug: role for role in roles})
+    _roles_by_id.clear()
+    _roles_by_id.update({role.id: role for role in roles})
+    _roles_loaded_at = time.monotonic()
+
+
+async def load_role_cache(db: AsyncSession) -> None:
+    """(Re)load all roles into the in-process cache."""
+    async with _role_cache_lock:
+        await _reload_role_cache(db)
+
+
+def clear_role_cache() -> None:
+    """Drop cached roles; the next lookup reloads them."""
+    global _roles_loaded_at
+    _roles_by_slug.clear()
+    _roles_by_id.clear()
+    _roles_loaded_at = None
+
+
+async def _ensure_role_cache(db: AsyncSession) -> None:
+    """Load the role cache if it is empty or has expired.
+
+    Freshness is checked again under the lock, so requests that queued up
+    behind one reload don't each read the table again.
+    """
+    if _role_cache_is_fresh():
+        return
+    async with _role_cache_lock:
+        if not _role_cache_is_fresh():
+            await _reload_role_cache(db)
+
 
 async def get_role_by_id(db: AsyncSession, role_id: int) -> Role | None:
     """Get a role by ID."""
-    result = await db.execute(select(Role).where(Role.id == role_id))
-    return result.scalar_one_or_none()
+    await _ensure_role_cache(db)
+    return _roles_by_id.get(role_id)
 
 
 async def get_role_by_slug(db: AsyncSession, slug: str) -> Role | None:
     """Get a role by slug."""
-    result = await db.execute(select(Role).where(Role.slug == slug))
-    return result.scalar_one_or_none()
+    await _ensure_role_cache(db)
+    return _roles_by_slug.get(slug)
 
 
 async def get_all_roles(db: AsyncSession) -> list[Role]:
     """Get all roles."""
-    result = await db.execute(select(Role))
-    return list(result.scalars().all())
+    await _ensure_role_cache(db)
+    return list(_roles_by_id.values())
 
 
 async def create_role(
@@ -95,6 +155,7 @@ async def create_role(
     role = Role(slug=slug, name=name, description=description)
     db.add(role)
     await db.flush()
+    clear_role_cache()
     return role
 
 
@@ -107,7 +168,29 @@ async def get_user_by_id(
     """Get a user by ID within tenant scope."""
     result = await db.execute(
         select(User)
-        .options(selectinload(User.role))
+        .options(joinedload(User.role))
+        .where(
+            and_(
+                User.id == user_id,
+                User.account_id == account_id,
+                User.company_id == company_id,
+            )
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_user_with_context(
+    db: AsyncSession, user_id: int, account_id: int, company_id: int
+) -> User | None:
+    """Get a user with role, account and company loaded in a single query."""
+    result = await db.execute(
+        select(User)
+        .options(
+            joinedload(User.role),
+            joinedload(User.account),
+            joinedload(User.company),
+        )
         .where(
             and_(
                 User.id == user_id,
@@ -125,7 +208,7 @@ async def get_user_by_email(
     """Get a user by email within tenant scope."""
     result = await db.execute(
         select(User)
-        .options(selectinload(User.role))
+        .options(joinedload(User.role))
         .where(
             and_(
                 User.email == email,
@@ -140,7 +223,7 @@ async def get_user_by_email(
 async def get_user_by_email_global(db: AsyncSession, email: str) -> User | None:
     """Get a user by email across all tenants (for login)."""
     result = await db.execute(
-        select(User).options(selectinload(User.role)).where(User.email == email)
+        select(User).options(joinedload(User.role)).where(User.email == email)
     )
     return result.scalar_one_or_none()
 
@@ -154,16 +237,18 @@ async def get_users_by_tenant(
     is_active: bool | None = None,
 ) -> list[User]:
     """Get all users within tenant scope."""
+    # Role is many-to-one, so join it into the page query instead of a
+    # second SELECT ... IN round trip
     query = (
         select(User)
-        .options(selectinload(User.role))
+        .options(joinedload(User.role))
         .where(and_(User.account_id == account_id, User.company_id == company_id))
     )
     if is_active is not None:
         query = query.where(User.is_active == is_active)
     query = query.offset(skip).limit(limit)
     result = await db.execute(query)
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def create_user(
@@ -176,26 +261,16 @@ async def create_user(
     last_name: str | None,
     role_id: int,
 ) -> User:
-    """Create a new user."""
-    import uuid
-
-    # Get next ID for this tenant
-    result = await db.execute(
-        select(User.id)
-        .where(and_(User.account_id == account_id, User.company_id == company_id))
-        .order_by(User.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
+    """Create a new user.
 
+    The tenant-scoped id is allocated from the tenant id counter when the row
+    is flushed, and the uuid comes from the column default.
+    """
     user = User(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         email=email,
-        password_hash=hash_password(password),
+        password_hash=await hash_password_async(password),
         first_name=first_name,
         last_name=last_name,
         role_id=role_id,
@@ -207,11 +282,13 @@ async def create_user(
 
 
 async def update_user_last_login(db: AsyncSession, user: User) -> None:
-    """Update user's last login timestamp."""
-    user.last_login = datetime.now(timezone.utc)
+    """Update user's last login timestamp.
+
+    Not flushed here; the UPDATE goes out with the caller's commit.
+    """
+    user.last_login = utc_now()
     user.failed_login_attempts = 0
     user.locked_until = None
-    await db.flush()
 
 
 async def increment_failed_login(db: AsyncSession, user: User) -> None:
@@ -249,7 +326,7 @@ async def update_user(
 
 async def update_user_password(db: AsyncSession, user: User, new_password: str) -> None:
     """Update user's password."""
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await hash_password_async(new_password)
     await db.flush()
 
 
@@ -264,7 +341,10 @@ async def create_refresh_token(
     user_agent: str | None = None,
     ip_address: str | None = None,
 ) -> RefreshToken:
-    """Create a new refresh token."""
+    """Create a new refresh token.
+
+    Not flushed here; the INSERT goes out with the caller's commit.
+    """
     refresh_token = RefreshToken(
         user_account_id=user.account_id,
         user_company_id=user.company_id,
@@ -275,24 +355,91 @@ async def create_refresh_token(
         ip_address=ip_address,
     )
     db.add(refresh_token)
-    await db.flush()
     return refresh_token
 
 
 async def get_refresh_token_by_hash(
-    db: AsyncSession, token_hash: str
+    db: AsyncSession, token_hash: str, check_valid: bool = True
 ) -> RefreshToken | None:
-    """Get a refresh token by its hash."""
-    result = await db.execute(
-        select(RefreshToken).where(RefreshToken.token_hash == token_hash)
+    """Get a refresh token by its hash.
+
+    With check_valid (the default) revoked and expired tokens are filtered out
+    in SQL, so only a usable token is ever returned.
+
+    Only the columns in ix_refresh_tokens_hash are loaded, so the lookup is an
+    index-only read; user_agent, ip_address and created_at are not loaded.
+    """
+    query = (
+        select(RefreshToken)
+        .options(
+            load_only(
+                RefreshToken.token_hash,
+                RefreshToken.expires_at,
+                RefreshToken.revoked_at,
+                RefreshToken.user_account_id,
+                RefreshToken.user_company_id,
+                RefreshToken.user_id,
+            )
+        )
+        .where(RefreshToken.token_hash == token_hash)
     )
+    if check_valid:
+        # Compare against the app's UTC clock rather than the DB session's NOW()
+        query = query.where(
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > utc_now(),
+        )
+    result = await db.execute(query)
     return result.scalar_one_or_none()
 
 
+async def consume_refresh_token(
+    db: AsyncSession, token_hash: str
+) -> tuple[RefreshToken, User] | None:
+    """Claim a usable refresh token and load its user (with role) in one query.
+
+    The token row is read with SELECT ... FOR UPDATE, so a concurrent refresh
+    with the same token waits for this transaction and then no longer finds
+    it usable; each refresh token can be redeemed only once. The token is
+    marked revoked here; the UPDATE goes out with the caller's commit.
+
+    Returns:
+        (token, user), or None if the token is unknown, revoked or expired
+    """
+    now = utc_now()
+    result = await db.execute(
+        select(RefreshToken, User)
+        .join(
+            User,
+            and_(
+                User.account_id == RefreshToken.user_account_id,
+                User.company_id == RefreshToken.user_company_id,
+                User.id == RefreshToken.user_id,
+            ),
+        )
+        .options(joinedload(User.role))
+        .where(
+            RefreshToken.token_hash == token_hash,
+            RefreshToken.revoked_at.is_(None),
+            RefreshToken.expires_at > now,
+        )
+        .with_for_update(of=RefreshToken)
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    token, user = row
+    token.revoked_at = now
+    return token, user
+
+
 async def revoke_refresh_token(db: AsyncSession, token: RefreshToken) -> None:
-    """Revoke a refresh token."""
-    token.revoked_at = datetime.now(timezone.utc)
-    await db.flush()
+    """Revoke a refresh token.
+
+    Not flushed here; the UPDATE goes out with the caller's commit.
+    """
+    token.revoked_at = utc_now()
 
 
 async def revoke_all_user_tokens(
@@ -300,7 +447,8 @@ async def revoke_all_user_tokens(
 ) -> int:
     """Revoke all refresh tokens for a user. Returns count of revoked tokens."""
     result = await db.execute(
-        select(RefreshToken).where(
+        update(RefreshToken)
+        .where(
             and_(
                 RefreshToken.user_account_id == account_id,
                 RefreshToken.user_company_id == company_id,
@@ -308,10 +456,7 @@ async def revoke_all_user_tokens(
                 RefreshToken.revoked_at.is_(None),
             )
         )
+        .values(revoked_at=utc_now())
+        .execution_options(synchronize_session="evaluate")
     )
-    tokens = result.scalars().all()
-    now = datetime.now(timezone.utc)
-    for token in tokens:
-        token.revoked_at = now
-    await db.flush()
-    return len(tokens)
+    return result.rowcount
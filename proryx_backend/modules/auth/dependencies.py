@@ -1,6 +1,7 @@
 """Authentication dependencies for FastAPI."""
 
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -11,6 +12,12 @@ from .schemas import AuthenticatedUser
 
 security = HTTPBearer()
 
+# Only the 401 detail and headers are shared; each raise builds a fresh
+# HTTPException so no traceback or context is carried between requests
+_BEARER_CHALLENGE = {"WWW-Authenticate": "Bearer"}
+_INVALID_TOKEN_DETAIL = "Invalid or expired token"
+_INVALID_TOKEN_PAYLOAD_DETAIL = "Invalid token payload"
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -26,14 +33,15 @@ async def get_current_user(
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token",
-            headers={"WWW-Authenticate": "Bearer"},
+            detail=_INVALID_TOKEN_DETAIL,
+            headers=_BEARER_CHALLENGE,
         )
 
     try:
+        uuid = payload.get("uuid")  # Optional - may not be in token
         return AuthenticatedUser(
             id=int(payload["sub"]),
-            uuid=payload.get("uuid"),  # Optional - may not be in token
+            uuid=UUID(uuid) if uuid else None,
             account_id=payload["account_id"],
             company_id=payload["company_id"],
             email=payload["email"],
@@ -42,12 +50,12 @@ async def get_current_user(
             role_slug=payload["role"],
             is_active=True,  # If token is valid, user was active at token creation
         )
-    except (KeyError, ValueError) as e:
+    except (KeyError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Invalid token payload: {e}",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+            detail=_INVALID_TOKEN_PAYLOAD_DETAIL,
+            headers=_BEARER_CHALLENGE,
+        ) from None
 
 
 def require_role(*allowed_roles: str | RoleSlug):
@@ -68,8 +76,12 @@ def require_role(*allowed_roles: str | RoleSlug):
         ):
             ...
     """
-    # Convert all roles to string slugs for comparison
-    role_slugs = {r.value if isinstance(r, RoleSlug) else r for r in allowed_roles}
+    # Convert all roles to string slugs for comparison; the 403 detail is
+    # built once here rather than on every denied request
+    role_slugs = frozenset(
+        r.value if isinstance(r, RoleSlug) else r for r in allowed_roles
+    )
+    denied_detail = f"Access denied. Required roles: {', '.join(sorted(role_slugs))}"
 
     async def role_checker(
         current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
@@ -77,7 +89,7 @@ def require_role(*allowed_roles: str | RoleSlug):
         if current_user.role_slug not in role_slugs:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required roles: {', '.join(role_slugs)}",
+                detail=denied_detail,
             )
         return current_user
 
@@ -2,11 +2,15 @@
 
 import hashlib
 import secrets
-from datetime import datetime, timedelta, timezone
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
 
 import jwt
+import orjson
 
 from ...config import settings
+from ...core.utils import utc_now
 
 # JWT Configuration
 ALGORITHM = "HS256"
@@ -14,6 +18,42 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 REFRESH_TOKEN_REMEMBER_ME_DAYS = 30
 
+# HMAC key as bytes and the accepted algorithms, built once instead of per call
+_SIGNING_KEY = settings.jwt_secret_key.encode("utf-8")
+_ALGORITHMS = [ALGORITHM]
+
+_sha256 = hashlib.sha256
+
+
+class _OrjsonJWT(jwt.PyJWT):
+    """PyJWT with the claims segment encoded/decoded by orjson instead of json."""
+
+    def _encode_payload(self, payload, headers=None, json_encoder=None) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict) -> dict:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = _OrjsonJWT()
+
+# Decoded access tokens (LRU), each kept until its own `exp`, so repeat requests
+# with the same bearer token skip signature verification and JSON parsing.
+_DECODE_CACHE_SIZE = 10_000
+_decode_cache: OrderedDict[str, dict] = OrderedDict()
+
+# Signed access tokens (LRU) by claim set, reused for a few seconds so bursts
+# of logins/refreshes for the same user don't re-sign identical payloads.
+_SIGN_CACHE_TTL_SECONDS = 15
+_SIGN_CACHE_SIZE = 10_000
+_sign_cache: OrderedDict[tuple, tuple[str, int]] = OrderedDict()
+
 
 def create_access_token(
     user_id: int,
@@ -23,13 +63,24 @@ def create_access_token(
     role_slug: str,
     expires_delta: timedelta | None = None,
 ) -> str:
-    """Create a JWT access token."""
+    """Create a JWT access token.
+
+    Tokens with the default lifetime are reused for the same claims for up to
+    _SIGN_CACHE_TTL_SECONDS, so they may expire up to that much sooner than a
+    freshly signed one.
+    """
+    # exp/iat are NumericDate claims; PyJWT would truncate datetimes to whole
+    # seconds anyway, so use integer epoch seconds directly
+    now = int(time.time())
+    key = (user_id, account_id, company_id, email, role_slug)
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(
-            minutes=ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        cached = _sign_cache.get(key)
+        if cached is not None and now - cached[1] < _SIGN_CACHE_TTL_SECONDS:
+            _sign_cache.move_to_end(key)
+            return cached[0]
+        expire = now + ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
     payload = {
         "sub": str(user_id),
@@ -38,11 +89,17 @@ def create_access_token(
         "email": email,
         "role": role_slug,
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": now,
         "type": "access",
     }
 
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=ALGORITHM)
+    token = _jwt.encode(payload, _SIGNING_KEY, algorithm=ALGORITHM)
+    if not expires_delta:
+        _sign_cache[key] = (token, now)
+        _sign_cache.move_to_end(key)
+        if len(_sign_cache) > _SIGN_CACHE_SIZE:
+            _sign_cache.popitem(last=False)
+    return token
 
 
 def create_refresh_token(remember_me: bool = False) -> tuple[str, datetime]:
@@ -52,30 +109,48 @@ def create_refresh_token(remember_me: bool = False) -> tuple[str, datetime]:
         Tuple of (token_string, expiry_datetime)
     """
     token = secrets.token_urlsafe(32)
-    if remember_me:
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            days=REFRESH_TOKEN_REMEMBER_ME_DAYS
-        )
-    else:
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            days=REFRESH_TOKEN_EXPIRE_DAYS
-        )
+    days = REFRESH_TOKEN_REMEMBER_ME_DAYS if remember_me else REFRESH_TOKEN_EXPIRE_DAYS
+    expires_at = utc_now() + timedelta(days=days)
     return token, expires_at
 
 
 def hash_refresh_token(token: str) -> str:
-    """Hash a refresh token for storage."""
-    return hashlib.sha256(token.encode()).hexdigest()
+    """Hash a refresh token for storage.
+
+    The token is client-supplied, so it is UTF-8 encoded rather than assumed
+    ASCII. The digest stays SHA-256 hex so hashes already stored in
+    refresh_tokens keep matching.
+    """
+    return _sha256(token.encode()).hexdigest()
 
 
 def decode_access_token(token: str) -> dict | None:
     """Decode and validate a JWT access token.
 
+    Successfully decoded payloads are cached per token until they expire.
+
     Returns:
         Token payload if valid, None if invalid or expired.
     """
+    payload = _decode_cache.get(token)
+    if payload is not None:
+        if payload["exp"] > time.time():
+            _decode_cache.move_to_end(token)
+            return payload
+        del _decode_cache[token]
+
+    payload = _decode_access_token(token)
+    if payload is not None and "exp" in payload:
+        _decode_cache[token] = payload
+        if len(_decode_cache) > _DECODE_CACHE_SIZE:
+            _decode_cache.popitem(last=False)
+    return payload
+
+
+def _decode_access_token(token: str) -> dict | None:
+    """Verify and decode a JWT access token without the cache."""
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[ALGORITHM])
+        payload = _jwt.decode(token, _SIGNING_KEY, algorithms=_ALGORITHMS)
         if payload.get("type") != "access":
             return None
         return payload
@@ -21,7 +21,7 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from ...core.database_types import UUID as UUID_DB
-from ...database import AccountScoped, Base, TimestampMixin
+from ...database import AccountScoped, Base, TimestampMixin, new_uuid
 
 
 class Account(TimestampMixin, Base):
@@ -33,7 +33,9 @@ class Account(TimestampMixin, Base):
     __tablename__ = "accounts"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    uuid: Mapped[str] = mapped_column(UUID_DB(), unique=True, nullable=False)
+    uuid: Mapped[str] = mapped_column(
+        UUID_DB(), default=new_uuid, unique=True, nullable=False
+    )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
@@ -56,7 +58,9 @@ class Company(TimestampMixin, Base):
     __tablename__ = "companies"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    uuid: Mapped[str] = mapped_column(UUID_DB(), unique=True, nullable=False)
+    uuid: Mapped[str] = mapped_column(
+        UUID_DB(), default=new_uuid, unique=True, nullable=False
+    )
     account_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False
     )
@@ -122,6 +126,9 @@ class User(AccountScoped, TimestampMixin, Base):
 
     # Relationships
     role: Mapped["Role"] = relationship("Role")
+    # Tenant context; the FKs come from AccountScoped and are part of the PK
+    account: Mapped["Account"] = relationship("Account", viewonly=True)
+    company: Mapped["Company"] = relationship("Company", viewonly=True)
 
     __table_args__ = (
         Index("ix_users_email", "account_id", "company_id", "email", unique=True),
@@ -165,13 +172,31 @@ class RefreshToken(Base):
         Index(
             "ix_refresh_tokens_user", "user_account_id", "user_company_id", "user_id"
         ),
-        Index("ix_refresh_tokens_hash", "token_hash"),
+        # Covers the refresh lookup (InnoDB appends the primary key), so it is
+        # answered from the index alone; uniqueness comes from the constraint
+        Index(
+            "ix_refresh_tokens_hash",
+            "token_hash",
+            "expires_at",
+            "revoked_at",
+            "user_account_id",
+            "user_company_id",
+            "user_id",
+        ),
     )
 
     @property
     def is_expired(self) -> bool:
-        """Check if token is expired."""
-        return datetime.now(self.expires_at.tzinfo) > self.expires_at
+        """Check if token is expired.
+
+        Reads the clock on every access; when checking many tokens, take one
+        ``now`` and use expired_as_of() instead.
+        """
+        return self.expired_as_of(datetime.now(self.expires_at.tzinfo))
+
+    def expired_as_of(self, now: datetime) -> bool:
+        """Check if token is expired at ``now`` (same tz-awareness as expires_at)."""
+        return now > self.expires_at
 
     @property
     def is_revoked(self) -> bool:
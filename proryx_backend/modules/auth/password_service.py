@@ -1,16 +1,120 @@
 """Password hashing service for ProRyx."""
 
+import asyncio
+import math
+import os
+import secrets
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+# bcrypt cost factor used for new hashes; raised by calibrate_bcrypt_rounds().
+# Existing hashes keep verifying with the cost stored in them.
+MIN_BCRYPT_ROUNDS = 12
+MAX_BCRYPT_ROUNDS = 16
+_bcrypt_rounds = MIN_BCRYPT_ROUNDS
+
+# Cheap cost factor timed during calibration; each extra round doubles the work
+_CALIBRATION_ROUNDS = 8
+_CALIBRATION_SAMPLES = 5
+
+_BCRYPT_MAX_BYTES = 72
+
+# bcrypt releases the GIL while hashing, so threads run on separate cores; a
+# dedicated pool sized to the CPU count keeps a burst of logins from
+# oversubscribing the host or starving the loop's default executor.
+_hash_pool: ThreadPoolExecutor | None = None
+
+# Throwaway hash checked when a login names no known user, so that path costs
+# the same as a wrong password. Rebuilt at the calibrated cost on startup.
+_dummy_hash: str | None = None
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1, thread_name_prefix="bcrypt"
+        )
+    return _hash_pool
+
+
+def calibrate_bcrypt_rounds(target_ms: float) -> int:
+    """Pick the strongest bcrypt cost factor whose hash time fits target_ms.
+
+    Times a few hashes at a low cost factor on this host and extrapolates,
+    since bcrypt's work doubles with every round. The result is clamped to
+    [MIN_BCRYPT_ROUNDS, MAX_BCRYPT_ROUNDS] and used for all new hashes,
+    including the dummy hash behind verify_dummy_password().
+
+    Args:
+        target_ms: Wall-clock budget for a single hash in milliseconds
+
+    Returns:
+        The selected cost factor
+    """
+    global _bcrypt_rounds, _dummy_hash
+
+    password = b"x" * 16
+    salt = bcrypt.gensalt(rounds=_CALIBRATION_ROUNDS)
+    samples = []
+    for _ in range(_CALIBRATION_SAMPLES):
+        start = time.perf_counter()
+        bcrypt.hashpw(password, salt)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    sample_ms = statistics.median(samples)
+    rounds = _CALIBRATION_ROUNDS + math.floor(math.log2(target_ms / sample_ms))
+    _bcrypt_rounds = max(MIN_BCRYPT_ROUNDS, min(MAX_BCRYPT_ROUNDS, rounds))
+    _dummy_hash = hash_password(secrets.token_urlsafe(16))
+    return _bcrypt_rounds
+
+
+def _bcrypt_input(password: str) -> bytes:
+    """Encode a password for bcrypt, which only uses the first 72 bytes.
+
+    bcrypt < 5 truncated silently; bcrypt 5 raises instead, so truncate here
+    to keep long passwords working and existing hashes verifiable.
+    """
+    return password.encode("utf-8")[:_BCRYPT_MAX_BYTES]
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+    salt = bcrypt.gensalt(rounds=_bcrypt_rounds)
+    return bcrypt.hashpw(_bcrypt_input(password), salt).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return bcrypt.checkpw(
-        plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+        _bcrypt_input(plain_password), hashed_password.encode("utf-8")
     )
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the bcrypt pool so it doesn't block the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the bcrypt pool so it doesn't block the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_hash_pool(), verify_password, plain_password, hashed_password
+    )
+
+
+async def verify_dummy_password(plain_password: str) -> None:
+    """Spend one password verification without a real user to check against.
+
+    Used on the unknown-user login path so its latency matches a wrong
+    password and doesn't reveal whether the email exists.
+    """
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = await hash_password_async(secrets.token_urlsafe(16))
+    await verify_password_async(plain_password, _dummy_hash)
@@ -5,6 +5,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.exceptions import NotFoundError
 from ...database import get_db
 from ..commons import BaseResponse
 from . import crud, services
@@ -106,8 +107,10 @@ async def get_current_user_info(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Get current user's profile with account and company context."""
-    # Fetch full user data from database
-    user = await crud.get_user_by_id(
+    # Fetch user with role, account and company in one query. Splitting this
+    # into concurrent lookups would not help: an AsyncSession runs one
+    # statement at a time, so asyncio.gather on it is not allowed.
+    user = await crud.get_user_with_context(
         db,
         user_id=current_user.id,
         account_id=current_user.account_id,
@@ -115,14 +118,8 @@ async def get_current_user_info(
     )
 
     if not user:
-        from ...core.exceptions import NotFoundError
-
         raise NotFoundError("User not found")
 
-    # Get account and company names
-    account = await crud.get_account_by_id(db, current_user.account_id)
-    company = await crud.get_company_by_id(db, current_user.company_id)
-
     return BaseResponse(
         success=True,
         data=UserWithContext(
@@ -138,8 +135,8 @@ async def get_current_user_info(
             is_active=user.is_active,
             last_login=user.last_login,
             created_at=user.created_at,
-            account_name=account.name if account else "Unknown",
-            company_name=company.name if company else "Unknown",
+            account_name=user.account.name if user.account else "Unknown",
+            company_name=user.company.name if user.company else "Unknown",
         ),
     )
 
@@ -1,9 +1,17 @@
 """Authentication schemas for ProRyx."""
 
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints
+
+# Cheap "looks like an email" check for logins; full EmailStr validation is
+# only applied where new addresses are accepted (UserCreate)
+LoginEmail = Annotated[
+    str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)
+]
 
 # ----- Account Schemas -----
 
@@ -28,8 +36,7 @@ class AccountResponse(AccountBase):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Company Schemas -----
@@ -56,8 +63,7 @@ class CompanyResponse(CompanyBase):
     is_active: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Role Schemas -----
@@ -71,8 +77,7 @@ class RoleResponse(BaseModel):
     name: str
     description: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- User Schemas -----
@@ -105,6 +110,7 @@ class UserUpdate(BaseModel):
 class UserResponse(UserBase):
     """Schema for user response."""
 
+    email: str  # Read back from the DB, already validated on the way in
     id: int
     uuid: UUID
     account_id: int
@@ -115,8 +121,7 @@ class UserResponse(UserBase):
     last_login: datetime | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserWithContext(UserResponse):
@@ -132,7 +137,7 @@ class UserWithContext(UserResponse):
 class LoginRequest(BaseModel):
     """Schema for login request."""
 
-    email: EmailStr
+    email: LoginEmail
     password: str
     remember_me: bool = False
 
@@ -159,8 +164,14 @@ class ChangePasswordRequest(BaseModel):
     new_password: str = Field(..., min_length=8, max_length=128)
 
 
-class AuthenticatedUser(BaseModel):
-    """Authenticated user context for request handling."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthenticatedUser:
+    """Authenticated user context for request handling.
+
+    A plain dataclass rather than a Pydantic model: it is built on every
+    authenticated request from an already-verified token, so there is nothing
+    to validate.
+    """
 
     id: int
     uuid: UUID | None = None  # Optional - not included in JWT token
@@ -174,9 +185,8 @@ class AuthenticatedUser(BaseModel):
 
     @property
     def full_name(self) -> str:
+        # Computed on access: slots=True rules out cached_property, and
+        # precomputing it would cost every request for a rarely read value
         if self.last_name:
             return f"{self.first_name} {self.last_name}"
         return self.first_name
-
-    class Config:
-        from_attributes = True
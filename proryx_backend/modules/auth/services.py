@@ -1,6 +1,6 @@
 """Authentication business logic services."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,6 +9,7 @@ from ...core.exceptions import (
     NotFoundError,
     ValidationError,
 )
+from ...core.utils import utc_now
 from . import crud
 from .jwt_service import (
     create_access_token,
@@ -17,7 +18,7 @@ from .jwt_service import (
     hash_refresh_token,
 )
 from .models import User
-from .password_service import verify_password
+from .password_service import verify_dummy_password, verify_password_async
 from .schemas import TokenResponse
 
 # Account lockout settings
@@ -52,13 +53,16 @@ async def authenticate_user(
     # Find user by email (global search for login)
     user = await crud.get_user_by_email_global(db, email)
     if not user:
+        # Still pay for a hash so unknown emails can't be told apart by timing
+        await verify_dummy_password(password)
         raise AuthenticationError("Invalid email or password")
 
     # Check if account is locked
-    if user.locked_until and user.locked_until > datetime.now(timezone.utc):
-        remaining = (user.locked_until - datetime.now(timezone.utc)).seconds // 60
+    now = utc_now()
+    if user.locked_until and user.locked_until > now:
+        remaining = int((user.locked_until - now).total_seconds() // 60) + 1
         raise AuthenticationError(
-            f"Account is locked. Try again in {remaining + 1} minutes."
+            f"Account is locked. Try again in {remaining} minutes."
         )
 
     # Check if user is active
@@ -66,14 +70,12 @@ async def authenticate_user(
         raise AuthenticationError("Account is disabled")
 
     # Verify password
-    if not verify_password(password, user.password_hash):
+    if not await verify_password_async(password, user.password_hash):
         await crud.increment_failed_login(db, user)
 
         # Lock account if too many failed attempts
         if user.failed_login_attempts >= MAX_FAILED_ATTEMPTS:
-            lock_until = datetime.now(timezone.utc) + timedelta(
-                minutes=LOCKOUT_DURATION_MINUTES
-            )
+            lock_until = now + timedelta(minutes=LOCKOUT_DURATION_MINUTES)
             await crud.lock_user(db, user, lock_until)
             raise AuthenticationError(
                 f"Account locked due to too many failed attempts. "
@@ -139,33 +141,21 @@ async def refresh_access_token(
     Raises:
         AuthenticationError: If refresh token is invalid or expired
     """
-    # Find refresh token
+    # hash_refresh_token is one unkeyed SHA-256 over the token with no per-call
+    # key or pepper setup; keep it that way, it runs on every refresh.
     token_hash = hash_refresh_token(refresh_token)
-    stored_token = await crud.get_refresh_token_by_hash(db, token_hash)
-
-    if not stored_token:
-        raise AuthenticationError("Invalid refresh token")
 
-    if stored_token.is_revoked:
-        raise AuthenticationError("Refresh token has been revoked")
+    # Lock, revoke and load the user in one query, so concurrent refreshes
+    # with the same token can't both succeed
+    consumed = await crud.consume_refresh_token(db, token_hash)
+    if consumed is None:
+        raise AuthenticationError("Invalid, expired or revoked refresh token")
 
-    if stored_token.is_expired:
-        raise AuthenticationError("Refresh token has expired")
-
-    # Get user
-    user = await crud.get_user_by_id(
-        db,
-        user_id=stored_token.user_id,
-        account_id=stored_token.user_account_id,
-        company_id=stored_token.user_company_id,
-    )
-
-    if not user or not user.is_active:
+    _, user = consumed
+    if not user.is_active:
+        # Nothing is committed, so the token's revocation is rolled back
         raise AuthenticationError("User not found or inactive")
 
-    # Revoke old refresh token
-    await crud.revoke_refresh_token(db, stored_token)
-
     # Generate new tokens
     access_token = create_access_token(
         user_id=user.id,
@@ -245,7 +235,7 @@ async def change_password(
     if not user:
         raise NotFoundError("User not found")
 
-    if not verify_password(current_password, user.password_hash):
+    if not await verify_password_async(current_password, user.password_hash):
         raise ValidationError("Current password is incorrect")
 
     await crud.update_user_password(db, user, new_password)
@@ -284,37 +274,32 @@ async def create_initial_admin(
     Raises:
         ValidationError: If account/user already exists
     """
-    import uuid
-
-    from sqlalchemy import select, text
+    from sqlalchemy import exists, select
 
     from .models import Account, Company, Role, RoleSlug
-    from .password_service import hash_password
+    from .password_service import hash_password_async
 
-    # Check if any accounts exist
-    result = await db.execute(text("SELECT id FROM accounts LIMIT 1"))
-    if result.scalar():
+    # Check if any accounts exist and get the admin role in one round trip
+    result = await db.execute(
+        select(
+            exists(select(Account.id)),
+            select(Role.id).where(Role.slug == RoleSlug.ADMIN.value).scalar_subquery(),
+        )
+    )
+    has_accounts, admin_role_id = result.one()
+    if has_accounts:
         raise ValidationError("Database already has accounts. Cannot seed.")
-
-    # Get admin role
-    result = await db.execute(select(Role).where(Role.slug == RoleSlug.ADMIN.value))
-    admin_role = result.scalar_one_or_none()
-    if not admin_role:
+    if admin_role_id is None:
         raise ValidationError("Admin role not found. Run migrations first.")
 
-    # Create account
+    # Create account and company; the Company.account relationship lets one
+    # flush insert both in FK order and fill in company.account_id
     account = Account(
-        uuid=str(uuid.uuid4()),
         name=account_name,
         is_active=True,
     )
-    db.add(account)
-    await db.flush()
-
-    # Create company
     company = Company(
-        uuid=str(uuid.uuid4()),
-        account_id=account.id,
+        account=account,
         name=company_name,
         is_active=True,
     )
@@ -326,12 +311,11 @@ async def create_initial_admin(
         account_id=account.id,
         company_id=company.id,
         id=1,  # First user in tenant
-        uuid=uuid.uuid4(),
         email=admin_email,
-        password_hash=hash_password(admin_password),
+        password_hash=await hash_password_async(admin_password),
         first_name=admin_first_name,
         last_name=admin_last_name,
-        role_id=admin_role.id,
+        role_id=admin_role_id,
         is_active=True,
     )
     db.add(user)
@@ -1,5 +1,6 @@
 """Common schemas and utilities shared across modules."""
 
+from .cursors import decode_cursor, encode_cursor
 from .schemas import (
     BaseResponse,
     PaginatedResponse,
@@ -12,4 +13,6 @@ __all__ = [
     "PaginatedResponse",
     "PaginationParams",
     "SortDirection",
+    "decode_cursor",
+    "encode_cursor",
 ]
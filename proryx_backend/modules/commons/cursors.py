@@ -0,0 +1,34 @@
+"""Opaque cursors for keyset (seek) pagination."""
+
+import base64
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+from ...core.exceptions import ValidationError
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of a page's last row as an opaque cursor string."""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, converters: tuple[Callable[[Any], Any], ...]) -> list:
+    """Decode a cursor made by encode_cursor().
+
+    Each value is passed through the matching converter (e.g. int,
+    datetime.fromisoformat), so the caller gets typed seek values back.
+
+    Raises:
+        ValidationError: If the cursor is malformed or doesn't match the
+            expected shape
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = orjson.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(converters):
+            raise ValueError("unexpected cursor shape")
+        return [convert(value) for convert, value in zip(converters, values)]
+    except (ValueError, TypeError) as e:
+        raise ValidationError("Invalid pagination cursor", field="cursor") from e
@@ -2,9 +2,12 @@
 
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from ...core.utils import utc_now
 
 T = TypeVar("T")
 
@@ -26,13 +29,15 @@ class BaseResponse(BaseModel, Generic[T]):
     data: T | None = Field(default=None, description="Response data")
     error: Any | None = Field(default=None, description="Error details if any")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Response timestamp"
+        default_factory=utc_now, description="Response timestamp"
     )
 
 
 class PaginationParams(BaseModel):
     """Pagination parameters."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     page: int = Field(default=1, ge=1, description="Page number")
     page_size: int = Field(default=20, ge=1, le=100, description="Items per page")
     sort_field: str | None = Field(default=None, description="Field to sort by")
@@ -40,7 +45,7 @@ class PaginationParams(BaseModel):
         default=None, description="Sort direction"
     )
 
-    @property
+    @cached_property
     def offset(self) -> int:
         return (self.page - 1) * self.page_size
 
@@ -49,18 +54,56 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """Paginated response schema."""
 
     items: list[T] = Field(default_factory=list, description="List of items")
-    total: int = Field(default=0, description="Total number of items")
-    page: int = Field(default=1, description="Current page number")
+    total: int | None = Field(
+        default=0, description="Total number of items (null if not counted)"
+    )
+    page: int | None = Field(
+        default=1, description="Current page number (null when paging by cursor)"
+    )
     page_size: int = Field(default=20, description="Items per page")
-    total_pages: int = Field(default=0, description="Total number of pages")
+    total_pages: int | None = Field(
+        default=0, description="Total number of pages (null if not counted)"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page, if there is one"
+    )
+    has_more: bool = Field(default=False, description="Whether more items follow")
 
     @classmethod
-    def from_items(cls, items: list[T], total: int, page: int, page_size: int):
-        total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
-        return cls(
+    def from_items(
+        cls,
+        items: list[T],
+        total: int | None,
+        page: int | None,
+        page_size: int,
+        next_cursor: str | None = None,
+    ):
+        """Build a page from already-validated items without validating again.
+
+        Items must already be response-schema instances; FastAPI still checks
+        the whole envelope against the route's response_model. A total of
+        None (not counted) leaves total_pages None too.
+
+        Routes that fetch one row past the page pass next_cursor whenever more
+        rows follow, so it alone decides has_more for them. Cursor requests
+        pass page=None; only plain page/total routes fall back to comparing
+        page against total_pages.
+        """
+        if total is None:
+            total_pages = None
+        else:
+            total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None
+            or (
+                page is not None
+                and total_pages is not None
+                and page < total_pages
+            ),
         )
@@ -1,39 +1,180 @@
 """CRUD operations for property management module."""
 
-from sqlalchemy import and_, func, select
+import asyncio
+import time
+from datetime import datetime
+
+from sqlalchemy import Row, Select, and_, bindparam, func, or_, select, update
+from sqlalchemy.dialects.mysql import match
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from .models import Property, PropertyStatus, Unit, UnitCategory, UnitStatus
 
+
+async def _fetch_page(
+    db: AsyncSession,
+    data_query: Select,
+    entity,
+    filters: list,
+    skip: int,
+    limit: int,
+    seek=None,
+    with_total: bool = True,
+) -> tuple[list, int | None]:
+    """Run a paged query and get the unpaged total in the same round trip.
+
+    COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so every row carries the
+    full match count. A page past the end has no rows to carry it, so only
+    then is a separate COUNT issued.
+
+    With a seek condition (keyset pagination) the page starts after the last
+    row of the previous one instead of at an OFFSET, so the database reads
+    only `limit` rows however deep the page is. The window count would then
+    only cover rows after the cursor, so the total comes from its own COUNT on
+    the same session (a second pooled connection per request could leave
+    every connection held by a request waiting for another).
+
+    With with_total=False no count is computed at all and the total is None;
+    callers that fetch one row more than they return can still tell whether
+    another page follows.
+    """
+    if not with_total:
+        if seek is not None:
+            data_query = data_query.where(seek)
+        else:
+            data_query = data_query.offset(skip)
+        result = await db.execute(data_query.limit(limit))
+        return list(result.scalars().all()), None
+
+    count_query = select(func.count(entity.id)).where(*filters)
+    if seek is not None:
+        result = await db.execute(data_query.where(seek).limit(limit))
+        total = (await db.execute(count_query)).scalar_one()
+        return list(result.scalars().all()), total
+
+    data_query = data_query.offset(skip).limit(limit)
+    rows = (await db.execute(data_query.add_columns(func.count().over()))).all()
+    if rows:
+        return [row[0] for row in rows], rows[0][1]
+    if not skip:
+        return [], 0
+    return [], (await db.execute(count_query)).scalar_one()
+
+
 # ----- Unit Category CRUD -----
 
+# Unit categories are a small lookup table that rarely changes, so they are
+# kept in process. Cached instances are expunged from the loading session
+# (detached). Other workers may add categories, so the cache expires after
+# _UNIT_CATEGORY_CACHE_TTL_SECONDS; until then a lookup that misses a fresh
+# cache is "not found" rather than a reload, since IDs and codes come from
+# clients.
+_UNIT_CATEGORY_CACHE_TTL_SECONDS = 300
+
+_unit_categories_by_id: dict[int, UnitCategory] = {}
+_unit_categories_by_code: dict[str, UnitCategory] = {}
+_unit_categories_loaded_at: float | None = None
+_unit_category_cache_lock = asyncio.Lock()
+
+
+def _unit_category_cache_is_fresh() -> bool:
+    """Whether the cache is loaded and younger than its TTL."""
+    return (
+        _unit_categories_loaded_at is not None
+        and time.monotonic() - _unit_categories_loaded_at
+        < _UNIT_CATEGORY_CACHE_TTL_SECONDS
+    )
+
+
+async def _reload_unit_category_cache(db: AsyncSession) -> None:
+    """Read all unit categories into the cache; the caller holds the lock."""
+    global _unit_categories_loaded_at
+    result = await db.execute(select(UnitCategory).order_by(UnitCategory.name))
+    categories = list(result.scalars().all())
+    for category in categories:
+        db.expunge(category)
+
+    _unit_categories_by_id.clear()
+    _unit_categories_by_id.update({c.id: c for c in categories})
+    _unit_categories_by_code.clear()
+    _unit_categories_by_code.update({c.code: c for c in categories})
+    _unit_categories_loaded_at = time.monotonic()
+
+
+async def load_unit_category_cache(db: AsyncSession) -> None:
+    """(Re)load all unit categories into the in-process cache."""
+    async with _unit_category_cache_lock:
+        await _reload_unit_category_cache(db)
+
+
+def clear_unit_category_cache() -> None:
+    """Drop cached unit categories; the next lookup reloads them."""
+    global _unit_categories_loaded_at
+    _unit_categories_by_id.clear()
+    _unit_categories_by_code.clear()
+    _unit_categories_loaded_at = None
+
+
+async def _ensure_unit_category_cache(db: AsyncSession) -> None:
+    """Load the unit category cache if it is empty or has expired.
+
+    Freshness is checked again under the lock, so requests that queued up
+    behind one reload don't each read the table again.
+    """
+    if _unit_category_cache_is_fresh():
+        return
+    async with _unit_category_cache_lock:
+        if not _unit_category_cache_is_fresh():
+            await _reload_unit_category_cache(db)
+
 
 async def get_unit_category_by_id(
     db: AsyncSession, category_id: int
 ) -> UnitCategory | None:
     """Get a unit category by ID."""
-    result = await db.execute(
-        select(UnitCategory).where(UnitCategory.id == category_id)
-    )
-    return result.scalar_one_or_none()
+    await _ensure_unit_category_cache(db)
+    return _unit_categories_by_id.get(category_id)
 
 
 async def get_unit_category_by_code(db: AsyncSession, code: str) -> UnitCategory | None:
     """Get a unit category by code."""
-    result = await db.execute(select(UnitCategory).where(UnitCategory.code == code))
-    return result.scalar_one_or_none()
+    await _ensure_unit_category_cache(db)
+    return _unit_categories_by_code.get(code)
 
 
 async def get_all_unit_categories(
     db: AsyncSession, is_active: bool | None = None
 ) -> list[UnitCategory]:
-    """Get all unit categories."""
-    query = select(UnitCategory)
+    """Get all unit categories, ordered by name."""
+    await _ensure_unit_category_cache(db)
+    # The cache is loaded in name order and dicts keep insertion order
+    categories = list(_unit_categories_by_id.values())
     if is_active is not None:
-        query = query.where(UnitCategory.is_active == is_active)
-    result = await db.execute(query.order_by(UnitCategory.name))
-    return list(result.scalars().all())
+        categories = [c for c in categories if c.is_active == is_active]
+    return categories
+
+
+async def _attach_categories(db: AsyncSession, units: list[Unit]) -> list[Unit]:
+    """Set Unit.category from the category cache instead of a selectin query.
+
+    Each cached category is merged into this session once (load=False, so no
+    SELECT); units never share the detached cache instances across sessions.
+    The value is set as already loaded, so the unit is not marked dirty and
+    no lazy load is triggered on access.
+    """
+    await _ensure_unit_category_cache(db)
+    merged: dict[int, UnitCategory | None] = {}
+    for unit in units:
+        category_id = unit.category_id
+        if category_id not in merged:
+            cached = _unit_categories_by_id.get(category_id)
+            merged[category_id] = (
+                await db.merge(cached, load=False) if cached is not None else None
+            )
+        set_committed_value(unit, "category", merged[category_id])
+    return units
 
 
 async def create_unit_category(
@@ -51,6 +192,7 @@ async def create_unit_category(
     )
     db.add(category)
     await db.flush()
+    clear_unit_category_cache()
     return category
 
 
@@ -73,11 +215,24 @@ async def get_property_by_id(
     ]
     if not include_deleted:
         filters.append(Property.is_deleted == False)  # noqa: E712
-    query = select(Property).where(and_(*filters))
-    if include_units:
-        query = query.options(selectinload(Property.units).selectinload(Unit.category))
-    result = await db.execute(query)
-    return result.scalar_one_or_none()
+    query = select(Property).where(*filters)
+    if not include_units:
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    # Property and units in one joined SELECT; categories come from the cache
+    result = await db.execute(query.options(joinedload(Property.units)))
+    property_obj = result.unique().scalar_one_or_none()
+    if property_obj is not None:
+        await _attach_categories(db, property_obj.units)
+    return property_obj
+
+
+_PROPERTY_BY_CODE = select(Property).where(
+    Property.property_code == bindparam("property_code"),
+    Property.account_id == bindparam("account_id"),
+    Property.company_id == bindparam("company_id"),
+)
 
 
 async def get_property_by_code(
@@ -88,17 +243,84 @@ async def get_property_by_code(
 ) -> Property | None:
     """Get a property by code within tenant scope."""
     result = await db.execute(
-        select(Property).where(
-            and_(
-                Property.property_code == property_code,
-                Property.account_id == account_id,
-                Property.company_id == company_id,
-            )
-        )
+        _PROPERTY_BY_CODE,
+        {
+            "property_code": property_code,
+            "account_id": account_id,
+            "company_id": company_id,
+        },
     )
     return result.scalar_one_or_none()
 
 
+def _live_property_filter(property_id: int, account_id: int, company_id: int):
+    """EXISTS condition: the property is present and not soft-deleted."""
+    return (
+        select(Property.id)
+        .where(
+            Property.id == property_id,
+            Property.account_id == account_id,
+            Property.company_id == company_id,
+            Property.is_deleted == False,  # noqa: E712
+        )
+        .exists()
+    )
+
+
+_PROPERTY_EXISTS = select(
+    _live_property_filter(
+        bindparam("property_id"), bindparam("account_id"), bindparam("company_id")
+    )
+)
+
+
+async def property_exists(
+    db: AsyncSession,
+    property_id: int,
+    account_id: int,
+    company_id: int,
+) -> bool:
+    """Check whether a property exists and is not soft-deleted."""
+    result = await db.execute(
+        _PROPERTY_EXISTS,
+        {
+            "property_id": property_id,
+            "account_id": account_id,
+            "company_id": company_id,
+        },
+    )
+    return bool(result.scalar())
+
+
+# Shortest token the ngram FULLTEXT parser indexes (MySQL's default
+# ngram_token_size); shorter terms cannot be looked up in the index
+_SEARCH_NGRAM_SIZE = 2
+
+
+def _property_search_filter(search: str):
+    """Substring match on name, code and address line 1.
+
+    Uses the ix_properties_search ngram FULLTEXT index: a quoted boolean-mode
+    phrase matches the term's consecutive ngrams, i.e. the term as a
+    substring. Terms shorter than one ngram fall back to a LIKE scan. Both
+    paths match the same cleaned term: quotes dropped, outer spaces trimmed.
+    """
+    term = search.replace('"', " ").strip()
+    if len(term) < _SEARCH_NGRAM_SIZE:
+        search_filter = f"%{term}%"
+        return (
+            (Property.property_name.ilike(search_filter))
+            | (Property.property_code.ilike(search_filter))
+            | (Property.address_line_1.ilike(search_filter))
+        )
+    return match(
+        Property.property_name,
+        Property.property_code,
+        Property.address_line_1,
+        against=f'"{term}"',
+    ).in_boolean_mode()
+
+
 async def get_properties(
     db: AsyncSession,
     account_id: int,
@@ -109,9 +331,16 @@ async def get_properties(
     usage_type: str | None = None,
     search: str | None = None,
     include_deleted: bool = False,
-) -> tuple[list[Property], int]:
+    after_created_at: datetime | None = None,
+    after_id: int | None = None,
+    with_total: bool = True,
+) -> tuple[list[Property], int | None]:
     """Get properties with filtering and pagination.
 
+    Pass after_created_at/after_id from the last property of the previous
+    page to seek past it instead of using skip. With with_total=False the
+    match count is skipped and None is returned in its place.
+
     Returns:
         Tuple of (list of properties, total count)
     """
@@ -130,30 +359,25 @@ async def get_properties(
     if usage_type:
         filters.append(Property.usage_type == usage_type)
     if search:
-        search_filter = f"%{search}%"
-        filters.append(
-            (Property.property_name.ilike(search_filter))
-            | (Property.property_code.ilike(search_filter))
-            | (Property.address_line_1.ilike(search_filter))
-        )
-
-    # Count query
-    count_query = select(func.count(Property.id)).where(and_(*filters))
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+        filters.append(_property_search_filter(search))
 
-    # Data query
+    # Data query; id breaks created_at ties so the seek key is unique
     data_query = (
         select(Property)
-        .where(and_(*filters))
-        .order_by(Property.created_at.desc())
-        .offset(skip)
-        .limit(limit)
+        .where(*filters)
+        .order_by(Property.created_at.desc(), Property.id.desc())
+    )
+    seek = None
+    if after_created_at is not None and after_id is not None:
+        # Expanded rather than a (created_at, id) row comparison, which
+        # MySQL doesn't turn into an index range scan
+        seek = or_(
+            Property.created_at < after_created_at,
+            and_(Property.created_at == after_created_at, Property.id < after_id),
+        )
+    return await _fetch_page(
+        db, data_query, Property, filters, skip, limit, seek=seek, with_total=with_total
     )
-    result = await db.execute(data_query)
-    properties = list(result.scalars().all())
-
-    return properties, total
 
 
 async def create_property(
@@ -169,25 +393,9 @@ async def create_property(
     **kwargs,
 ) -> Property:
     """Create a new property."""
-    import uuid
-
-    # Get next ID for this tenant
-    result = await db.execute(
-        select(Property.id)
-        .where(
-            and_(Property.account_id == account_id, Property.company_id == company_id)
-        )
-        .order_by(Property.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
-
     property_obj = Property(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         property_code=property_code,
         property_name=property_name,
         usage_type=usage_type,
@@ -215,11 +423,33 @@ async def update_property(
     return property_obj
 
 
-async def soft_delete_property(db: AsyncSession, property_obj: Property) -> Property:
-    """Soft-delete a property by setting is_deleted=True."""
-    property_obj.is_deleted = True
-    await db.flush()
-    return property_obj
+async def soft_delete_property(
+    db: AsyncSession,
+    property_id: int,
+    account_id: int,
+    company_id: int,
+) -> bool:
+    """Soft-delete a property unless it still has active (non-INACTIVE) units.
+
+    The active-units check is part of the UPDATE itself, so this is one round
+    trip. Returns False if nothing was updated: the property does not exist,
+    is already deleted, or has active units.
+    """
+    result = await db.execute(
+        update(Property)
+        .where(
+            and_(
+                Property.id == property_id,
+                Property.account_id == account_id,
+                Property.company_id == company_id,
+                Property.is_deleted == False,  # noqa: E712
+                Property.active_units_count == 0,
+            )
+        )
+        .values(is_deleted=True)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
 
 
 async def hard_delete_property(db: AsyncSession, property_obj: Property) -> None:
@@ -228,6 +458,13 @@ async def hard_delete_property(db: AsyncSession, property_obj: Property) -> None
     await db.flush()
 
 
+_ACTIVE_UNITS_COUNT = select(Property.active_units_count).where(
+    Property.id == bindparam("property_id"),
+    Property.account_id == bindparam("account_id"),
+    Property.company_id == bindparam("company_id"),
+)
+
+
 async def get_active_units_count(
     db: AsyncSession,
     property_id: int,
@@ -237,22 +474,88 @@ async def get_active_units_count(
     """Get count of active (non-INACTIVE) units for a property.
 
     Used for delete validation - cannot delete property with active units.
+    Reads the maintained Property.active_units_count instead of counting units.
     """
     result = await db.execute(
-        select(func.count(Unit.id)).where(
+        _ACTIVE_UNITS_COUNT,
+        {
+            "property_id": property_id,
+            "account_id": account_id,
+            "company_id": company_id,
+        },
+    )
+    return result.scalar_one_or_none() or 0
+
+
+async def _adjust_units_counts(
+    db: AsyncSession,
+    account_id: int,
+    company_id: int,
+    property_id: int,
+    total_delta: int,
+    active_delta: int,
+) -> None:
+    """Apply unit count deltas to a property in one atomic UPDATE."""
+    await db.execute(
+        update(Property)
+        .where(
             and_(
-                Unit.account_id == account_id,
-                Unit.company_id == company_id,
-                Unit.property_id == property_id,
-                Unit.status != UnitStatus.INACTIVE,
+                Property.id == property_id,
+                Property.account_id == account_id,
+                Property.company_id == company_id,
             )
         )
+        .values(
+            total_units_count=Property.total_units_count + total_delta,
+            active_units_count=Property.active_units_count + active_delta,
+        )
+        .execution_options(synchronize_session="evaluate")
     )
-    return result.scalar_one()
 
 
 # ----- Unit CRUD -----
 
+# Fixed-shape lookups are built once at import; each call only binds values
+_UNIT_BY_ID = (
+    select(Unit)
+    .options(selectinload(Unit.category))
+    .where(
+        Unit.id == bindparam("unit_id"),
+        Unit.account_id == bindparam("account_id"),
+        Unit.company_id == bindparam("company_id"),
+    )
+)
+
+_UNIT_BY_CODE = (
+    select(Unit)
+    .options(selectinload(Unit.category))
+    .where(
+        Unit.unit_code == bindparam("unit_code"),
+        Unit.property_id == bindparam("property_id"),
+        Unit.account_id == bindparam("account_id"),
+        Unit.company_id == bindparam("company_id"),
+    )
+)
+
+_ROOT_UNITS = (
+    select(Unit)
+    .where(
+        Unit.account_id == bindparam("account_id"),
+        Unit.company_id == bindparam("company_id"),
+        Unit.property_id == bindparam("property_id"),
+        Unit.parent_unit_id.is_(None),
+    )
+    .order_by(Unit.unit_code)
+)
+
+_CHILD_UNITS = [
+    Unit.account_id == bindparam("account_id"),
+    Unit.company_id == bindparam("company_id"),
+    Unit.parent_unit_id == bindparam("unit_id"),
+]
+_HAS_UNIT_CHILDREN = select(select(Unit.id).where(*_CHILD_UNITS).exists())
+_UNIT_CHILDREN_COUNT = select(func.count(Unit.id)).where(*_CHILD_UNITS)
+
 
 async def get_unit_by_id(
     db: AsyncSession,
@@ -262,8 +565,41 @@ async def get_unit_by_id(
     include_children: bool = False,
 ) -> Unit | None:
     """Get a unit by ID within tenant scope."""
-    query = (
-        select(Unit)
+    # Note: Unit.children relationship removed due to composite key complexity
+    # Child units should be fetched via get_child_units() in services.py if needed
+    if include_children:
+        pass  # Children fetched separately via application-level queries
+    result = await db.execute(
+        _UNIT_BY_ID,
+        {"unit_id": unit_id, "account_id": account_id, "company_id": company_id},
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_unit_with_has_children(
+    db: AsyncSession,
+    unit_id: int,
+    account_id: int,
+    company_id: int,
+) -> tuple[Unit, bool] | None:
+    """Get a unit and whether it has any child units in a single query.
+
+    EXISTS stops at the first child instead of counting them all.
+    """
+    children = aliased(Unit)
+    has_children = (
+        select(children.id)
+        .where(
+            and_(
+                children.account_id == Unit.account_id,
+                children.company_id == Unit.company_id,
+                children.parent_unit_id == Unit.id,
+            )
+        )
+        .exists()
+    )
+    result = await db.execute(
+        select(Unit, has_children)
         .options(selectinload(Unit.category))
         .where(
             and_(
@@ -273,12 +609,8 @@ async def get_unit_by_id(
             )
         )
     )
-    # Note: Unit.children relationship removed due to composite key complexity
-    # Child units should be fetched via get_child_units() in services.py if needed
-    if include_children:
-        pass  # Children fetched separately via application-level queries
-    result = await db.execute(query)
-    return result.scalar_one_or_none()
+    row = result.one_or_none()
+    return (row[0], bool(row[1])) if row is not None else None
 
 
 async def get_unit_by_code(
@@ -290,16 +622,13 @@ async def get_unit_by_code(
 ) -> Unit | None:
     """Get a unit by code within property and tenant scope."""
     result = await db.execute(
-        select(Unit)
-        .options(selectinload(Unit.category))
-        .where(
-            and_(
-                Unit.unit_code == unit_code,
-                Unit.property_id == property_id,
-                Unit.account_id == account_id,
-                Unit.company_id == company_id,
-            )
-        )
+        _UNIT_BY_CODE,
+        {
+            "unit_code": unit_code,
+            "property_id": property_id,
+            "account_id": account_id,
+            "company_id": company_id,
+        },
     )
     return result.scalar_one_or_none()
 
@@ -314,45 +643,46 @@ async def get_units_by_property(
     status: UnitStatus | None = None,
     is_leaf: bool | None = None,
     parent_unit_id: int | None = None,
-) -> tuple[list[Unit], int]:
+    after_unit_code: str | None = None,
+    with_total: bool = True,
+    require_live_property: bool = False,
+) -> tuple[list[Unit], int | None]:
     """Get units for a property with filtering.
 
+    Pass after_unit_code from the last unit of the previous page to seek past
+    it instead of using skip. Unit codes are unique within a property. With
+    with_total=False the match count is skipped and None is returned in its
+    place.
+
+    With require_live_property, units are only returned while the property
+    exists and is not soft-deleted; that is checked in the same query, so an
+    empty result is the only case that needs a separate property_exists().
+
     Returns:
         Tuple of (list of units, total count)
     """
     # Base filter
-    base_filter = and_(
+    filters = [
         Unit.account_id == account_id,
         Unit.company_id == company_id,
         Unit.property_id == property_id,
-    )
-
-    filters = [base_filter]
+    ]
     if status:
         filters.append(Unit.status == status)
     if is_leaf is not None:
         filters.append(Unit.is_leaf == is_leaf)
     if parent_unit_id is not None:
         filters.append(Unit.parent_unit_id == parent_unit_id)
-
-    # Count query
-    count_query = select(func.count(Unit.id)).where(and_(*filters))
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Data query
-    data_query = (
-        select(Unit)
-        .options(selectinload(Unit.category))
-        .where(and_(*filters))
-        .order_by(Unit.unit_code)
-        .offset(skip)
-        .limit(limit)
+    if require_live_property:
+        filters.append(_live_property_filter(property_id, account_id, company_id))
+
+    # Data query; the total comes back on every row
+    data_query = select(Unit).where(*filters).order_by(Unit.unit_code)
+    seek = Unit.unit_code > after_unit_code if after_unit_code is not None else None
+    units, total = await _fetch_page(
+        db, data_query, Unit, filters, skip, limit, seek=seek, with_total=with_total
     )
-    result = await db.execute(data_query)
-    units = list(result.scalars().all())
-
-    return units, total
+    return await _attach_categories(db, units), total
 
 
 async def get_root_units(
@@ -363,19 +693,14 @@ async def get_root_units(
 ) -> list[Unit]:
     """Get root units (no parent) for a property."""
     result = await db.execute(
-        select(Unit)
-        .options(selectinload(Unit.category))
-        .where(
-            and_(
-                Unit.account_id == account_id,
-                Unit.company_id == company_id,
-                Unit.property_id == property_id,
-                Unit.parent_unit_id.is_(None),
-            )
-        )
-        .order_by(Unit.unit_code)
+        _ROOT_UNITS,
+        {
+            "property_id": property_id,
+            "account_id": account_id,
+            "company_id": company_id,
+        },
     )
-    return list(result.scalars().all())
+    return await _attach_categories(db, list(result.scalars().all()))
 
 
 async def create_unit(
@@ -391,24 +716,14 @@ async def create_unit(
     status: UnitStatus = UnitStatus.AVAILABLE,
     **kwargs,
 ) -> Unit:
-    """Create a new unit."""
-    import uuid
-
-    # Get next ID for this tenant
-    result = await db.execute(
-        select(Unit.id)
-        .where(and_(Unit.account_id == account_id, Unit.company_id == company_id))
-        .order_by(Unit.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
+    """Create a new unit.
 
+    The category is set from the category cache, so the returned unit can be
+    serialized without reloading it.
+    """
     unit = Unit(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         property_id=property_id,
         unit_code=unit_code,
         display_name=name,
@@ -420,6 +735,15 @@ async def create_unit(
     )
     db.add(unit)
     await db.flush()
+    await _adjust_units_counts(
+        db,
+        account_id,
+        company_id,
+        property_id,
+        total_delta=1,
+        active_delta=int(status != UnitStatus.INACTIVE),
+    )
+    await _attach_categories(db, [unit])
     return unit
 
 
@@ -428,11 +752,27 @@ async def update_unit(
     unit: Unit,
     **kwargs,
 ) -> Unit:
-    """Update a unit."""
+    """Update a unit.
+
+    Unit.category is refreshed from the category cache, so it matches a
+    changed category_id without reloading the unit.
+    """
+    was_active = unit.status != UnitStatus.INACTIVE
     for key, value in kwargs.items():
         if value is not None and hasattr(unit, key):
             setattr(unit, key, value)
     await db.flush()
+    is_active = unit.status != UnitStatus.INACTIVE
+    if is_active != was_active:
+        await _adjust_units_counts(
+            db,
+            unit.account_id,
+            unit.company_id,
+            unit.property_id,
+            total_delta=0,
+            active_delta=1 if is_active else -1,
+        )
+    await _attach_categories(db, [unit])
     return unit
 
 
@@ -440,6 +780,28 @@ async def delete_unit(db: AsyncSession, unit: Unit) -> None:
     """Delete a unit."""
     await db.delete(unit)
     await db.flush()
+    await _adjust_units_counts(
+        db,
+        unit.account_id,
+        unit.company_id,
+        unit.property_id,
+        total_delta=-1,
+        active_delta=-int(unit.status != UnitStatus.INACTIVE),
+    )
+
+
+async def has_unit_children(
+    db: AsyncSession,
+    unit_id: int,
+    account_id: int,
+    company_id: int,
+) -> bool:
+    """Check whether a unit has any child units."""
+    result = await db.execute(
+        _HAS_UNIT_CHILDREN,
+        {"unit_id": unit_id, "account_id": account_id, "company_id": company_id},
+    )
+    return result.scalar_one()
 
 
 async def get_unit_children_count(
@@ -450,17 +812,51 @@ async def get_unit_children_count(
 ) -> int:
     """Get count of child units for a unit."""
     result = await db.execute(
-        select(func.count(Unit.id)).where(
-            and_(
-                Unit.account_id == account_id,
-                Unit.company_id == company_id,
-                Unit.parent_unit_id == unit_id,
-            )
-        )
+        _UNIT_CHILDREN_COUNT,
+        {"unit_id": unit_id, "account_id": account_id, "company_id": company_id},
     )
     return result.scalar_one()
 
 
+async def get_unit_ancestors(
+    db: AsyncSession,
+    unit_ids: set[int],
+    account_id: int,
+    company_id: int,
+) -> dict[int, Row]:
+    """Get the given units and all of their ancestors in one recursive query.
+
+    Returns rows of (id, parent_unit_id, unit_code, display_name) keyed by id,
+    so parent chains can be walked in memory instead of one query per level.
+    """
+    if not unit_ids:
+        return {}
+
+    tree = (
+        select(Unit.id, Unit.parent_unit_id, Unit.unit_code, Unit.display_name)
+        .where(
+            Unit.account_id == account_id,
+            Unit.company_id == company_id,
+            Unit.id.in_(unit_ids),
+        )
+        .cte("unit_ancestors", recursive=True)
+    )
+    parent = aliased(Unit)
+    # UNION (not UNION ALL) drops shared ancestors and stops on a cycle
+    tree = tree.union(
+        select(
+            parent.id, parent.parent_unit_id, parent.unit_code, parent.display_name
+        )
+        .join(tree, parent.id == tree.c.parent_unit_id)
+        .where(
+            parent.account_id == account_id,
+            parent.company_id == company_id,
+        )
+    )
+    result = await db.execute(select(tree))
+    return {row.id: row for row in result.all()}
+
+
 async def get_leaf_units(
     db: AsyncSession,
     property_id: int,
@@ -470,7 +866,10 @@ async def get_leaf_units(
     category_id: int | None = None,
     skip: int = 0,
     limit: int = 100,
-) -> tuple[list[Unit], int]:
+    after_unit_code: str | None = None,
+    with_total: bool = True,
+    require_live_property: bool = False,
+) -> tuple[list[Unit], int | None]:
     """Get all leaf units (rentable) for a property.
 
     Args:
@@ -482,6 +881,11 @@ async def get_leaf_units(
         category_id: Optional category filter
         skip: Pagination offset
         limit: Pagination limit
+        after_unit_code: Unit code of the previous page's last unit; seeks
+            past it instead of using skip
+        with_total: Whether to count all matches; the total is None if not
+        require_live_property: Return no units unless the property exists
+            and is not soft-deleted (checked in the same query)
 
     Returns:
         Tuple of (list of leaf units, total count)
@@ -498,25 +902,16 @@ async def get_leaf_units(
         filters.append(Unit.status == status)
     if category_id:
         filters.append(Unit.category_id == category_id)
-
-    # Count query
-    count_query = select(func.count(Unit.id)).where(and_(*filters))
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Data query
-    data_query = (
-        select(Unit)
-        .options(selectinload(Unit.category))
-        .where(and_(*filters))
-        .order_by(Unit.unit_code)
-        .offset(skip)
-        .limit(limit)
+    if require_live_property:
+        filters.append(_live_property_filter(property_id, account_id, company_id))
+
+    # Data query; the total comes back on every row
+    data_query = select(Unit).where(*filters).order_by(Unit.unit_code)
+    seek = Unit.unit_code > after_unit_code if after_unit_code is not None else None
+    units, total = await _fetch_page(
+        db, data_query, Unit, filters, skip, limit, seek=seek, with_total=with_total
     )
-    result = await db.execute(data_query)
-    units = list(result.scalars().all())
-
-    return units, total
+    return await _attach_categories(db, units), total
 
 
 async def get_leasable_units(
@@ -527,7 +922,10 @@ async def get_leasable_units(
     category_id: int | None = None,
     skip: int = 0,
     limit: int = 100,
-) -> tuple[list[Unit], int]:
+    after_property_id: int | None = None,
+    after_unit_code: str | None = None,
+    with_total: bool = True,
+) -> tuple[list[Unit], int | None]:
     """Get all leasable units (leaf + available) for the leasing screen.
 
     This is the main query for the leasing screen dropdown/selection.
@@ -540,6 +938,10 @@ async def get_leasable_units(
         category_id: Optional category filter
         skip: Pagination offset
         limit: Pagination limit
+        after_property_id: Property ID of the previous page's last unit
+        after_unit_code: Unit code of the previous page's last unit; with
+            after_property_id, seeks past it instead of using skip
+        with_total: Whether to count all matches; the total is None if not
 
     Returns:
         Tuple of (list of leasable units, total count)
@@ -557,21 +959,25 @@ async def get_leasable_units(
     if category_id:
         filters.append(Unit.category_id == category_id)
 
-    # Count query
-    count_query = select(func.count(Unit.id)).where(and_(*filters))
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
-
-    # Data query with property info
+    # Data query with property info; the total comes back on every row
     data_query = (
         select(Unit)
-        .options(selectinload(Unit.category), selectinload(Unit.property))
-        .where(and_(*filters))
+        .options(selectinload(Unit.property))
+        .where(*filters)
         .order_by(Unit.property_id, Unit.unit_code)
-        .offset(skip)
-        .limit(limit)
     )
-    result = await db.execute(data_query)
-    units = list(result.scalars().all())
-
-    return units, total
+    seek = None
+    if after_property_id is not None and after_unit_code is not None:
+        # Expanded rather than a row comparison so MySQL can range-scan
+        # ix_units_leasable
+        seek = or_(
+            Unit.property_id > after_property_id,
+            and_(
+                Unit.property_id == after_property_id,
+                Unit.unit_code > after_unit_code,
+            ),
+        )
+    units, total = await _fetch_page(
+        db, data_query, Unit, filters, skip, limit, seek=seek, with_total=with_total
+    )
+    return await _attach_categories(db, units), total
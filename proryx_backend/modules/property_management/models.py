@@ -9,12 +9,12 @@ import enum
 
 from sqlalchemy import (
     Boolean,
+    Double,
     Enum,
     ForeignKey,
     ForeignKeyConstraint,
     Index,
     Integer,
-    Numeric,
     String,
     Text,
 )
@@ -94,8 +94,10 @@ class Property(AccountScoped, TimestampMixin, Base):
     state: Mapped[str | None] = mapped_column(String(120), nullable=True)
     country: Mapped[str | None] = mapped_column(String(120), nullable=True)
     postal_code: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    latitude: Mapped[float] = mapped_column(Numeric(10, 7), nullable=False)
-    longitude: Mapped[float] = mapped_column(Numeric(10, 7), nullable=False)
+    # DOUBLE rather than DECIMAL: rows decode straight to float, with no
+    # Decimal per value
+    latitude: Mapped[float] = mapped_column(Double, nullable=False)
+    longitude: Mapped[float] = mapped_column(Double, nullable=False)
     total_floors: Mapped[int | None] = mapped_column(Integer, nullable=True)
     year_built: Mapped[int | None] = mapped_column(Integer, nullable=True)
     total_units_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -123,6 +125,24 @@ class Property(AccountScoped, TimestampMixin, Base):
             unique=True,
         ),
         Index("ix_properties_status", "account_id", "company_id", "status"),
+        # Matches the default list filter and its ORDER BY created_at, so a
+        # page is read in index order without a filesort
+        Index(
+            "ix_properties_list",
+            "account_id",
+            "company_id",
+            "is_deleted",
+            "created_at",
+        ),
+        # ngram FULLTEXT index for the substring search in get_properties
+        Index(
+            "ix_properties_search",
+            "property_name",
+            "property_code",
+            "address_line_1",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ),
     )
 
     def __repr__(self) -> str:
@@ -150,7 +170,7 @@ class Unit(AccountScoped, TimestampMixin, Base):
         String(10), nullable=True
     )  # Per spec: VARCHAR(10)
     room_number: Mapped[str | None] = mapped_column(String(20), nullable=True)
-    area_sqm: Mapped[float | None] = mapped_column(Numeric(10, 2), nullable=True)
+    area_sqm: Mapped[float | None] = mapped_column(Double, nullable=True)
     capacity: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
     is_leaf: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     sort_order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
@@ -188,7 +208,16 @@ class Unit(AccountScoped, TimestampMixin, Base):
         Index("ix_units_property", "account_id", "company_id", "property_id"),
         Index("ix_units_parent", "account_id", "company_id", "parent_unit_id"),
         Index("ix_units_status", "account_id", "company_id", "status"),
-        Index("ix_units_is_leaf", "account_id", "company_id", "is_leaf"),
+        # Leasable-unit filter followed by its ORDER BY (property_id, unit_code)
+        Index(
+            "ix_units_leasable",
+            "account_id",
+            "company_id",
+            "is_leaf",
+            "status",
+            "property_id",
+            "unit_code",
+        ),
     )
 
     def __repr__(self) -> str:
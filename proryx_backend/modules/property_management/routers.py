@@ -1,13 +1,17 @@
 """Property management API routes."""
 
-from typing import Annotated
+from collections.abc import Callable
+from datetime import datetime
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...core.exceptions import NotFoundError, ValidationError
 from ...database import get_db
 from ..auth.dependencies import CurrentUser
-from ..commons import BaseResponse, PaginatedResponse
+from ..commons import BaseResponse, PaginatedResponse, decode_cursor, encode_cursor
 from . import crud, services
 from .models import PropertyStatus, UnitStatus
 from .schemas import (
@@ -22,12 +26,39 @@ from .schemas import (
     UnitHierarchyResponse,
     UnitResponse,
     UnitUpdate,
+    build_response,
 )
 
 router = APIRouter(prefix="/properties", tags=["Properties"])
 units_router = APIRouter(prefix="/units", tags=["Units"])
 categories_router = APIRouter(prefix="/unit-categories", tags=["Unit Categories"])
 
+_CURSOR_QUERY = Query(
+    None,
+    description="Cursor from the previous page's next_cursor; replaces page",
+)
+_INCLUDE_TOTAL_QUERY = Query(
+    None,
+    description=(
+        "Count all matches for total/total_pages; "
+        "on by default for page requests, off with a cursor"
+    ),
+)
+
+
+def _split_page(
+    rows: list, page_size: int, sort_key: Callable[[Any], tuple]
+) -> tuple[list, str | None]:
+    """Trim a page fetched with limit=page_size + 1 and build its next cursor.
+
+    The extra row only signals that another page follows; the cursor encodes
+    the sort key of the last row actually returned.
+    """
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_cursor(*sort_key(rows[-1]))
+
 
 # ----- Unit Categories -----
 
@@ -42,7 +73,7 @@ async def list_unit_categories(
     categories = await crud.get_all_unit_categories(db, is_active=is_active)
     return BaseResponse(
         success=True,
-        data=[UnitCategoryResponse.model_validate(c) for c in categories],
+        data=[build_response(UnitCategoryResponse, c) for c in categories],
     )
 
 
@@ -57,8 +88,6 @@ async def get_unit_category(
     """Get a unit category by ID."""
     category = await crud.get_unit_category_by_id(db, category_id)
     if not category:
-        from ...core.exceptions import NotFoundError
-
         raise NotFoundError(f"Unit category with ID {category_id} not found")
     return BaseResponse(
         success=True,
@@ -73,20 +102,19 @@ async def create_unit_category(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Create a new unit category (admin only)."""
-    # Check for duplicate code
-    existing = await crud.get_unit_category_by_code(db, data.code.upper())
-    if existing:
-        from ...core.exceptions import ValidationError
-
-        raise ValidationError(f"Category with code '{data.code}' already exists")
-
-    category = await crud.create_unit_category(
-        db,
-        code=data.code,
-        name=data.name,
-        description=data.description,
-    )
-    await db.commit()
+    # unit_categories.code is unique, so a duplicate fails the INSERT instead
+    # of being looked up first
+    try:
+        category = await crud.create_unit_category(
+            db,
+            code=data.code,
+            name=data.name,
+            description=data.description,
+        )
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        raise ValidationError(f"Category with code '{data.code}' already exists") from e
 
     return BaseResponse(
         success=True,
@@ -107,27 +135,44 @@ async def list_properties(
     status: PropertyStatus | None = Query(None),
     usage_type: str | None = Query(None),
     search: str | None = Query(None),
+    cursor: str | None = _CURSOR_QUERY,
+    include_total: bool | None = _INCLUDE_TOTAL_QUERY,
 ):
-    """Get properties with pagination and filtering."""
-    skip = (page - 1) * page_size
+    """Get properties with pagination and filtering.
+
+    Pass the previous page's next_cursor to seek straight to the next page;
+    page is only used when no cursor is given.
+    """
+    after_created_at = after_id = None
+    if cursor:
+        after_created_at, after_id = decode_cursor(
+            cursor, (datetime.fromisoformat, int)
+        )
     properties, total = await crud.get_properties(
         db=db,
         account_id=current_user.account_id,
         company_id=current_user.company_id,
-        skip=skip,
-        limit=page_size,
+        skip=0 if cursor else (page - 1) * page_size,
+        limit=page_size + 1,
         status=status,
         usage_type=usage_type,
         search=search,
+        after_created_at=after_created_at,
+        after_id=after_id,
+        with_total=cursor is None if include_total is None else include_total,
+    )
+    properties, next_cursor = _split_page(
+        properties, page_size, lambda p: (p.created_at.isoformat(), p.id)
     )
 
     return BaseResponse(
         success=True,
         data=PaginatedResponse.from_items(
-            items=[PropertyResponse.model_validate(p) for p in properties],
+            items=[build_response(PropertyResponse, p) for p in properties],
             total=total,
-            page=page,
+            page=None if cursor else page,
             page_size=page_size,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -148,8 +193,6 @@ async def get_property(
         include_units=include_units,
     )
     if not property_obj:
-        from ...core.exceptions import NotFoundError
-
         raise NotFoundError(f"Property with ID {property_id} not found")
 
     return BaseResponse(
@@ -238,37 +281,43 @@ async def list_property_units(
     status: UnitStatus | None = Query(None),
     is_leaf: bool | None = Query(None),
     parent_unit_id: int | None = Query(None),
+    cursor: str | None = _CURSOR_QUERY,
+    include_total: bool | None = _INCLUDE_TOTAL_QUERY,
 ):
-    """Get units for a property with pagination and filtering."""
-    # Verify property exists
-    property_obj = await crud.get_property_by_id(
-        db, property_id, current_user.account_id, current_user.company_id
-    )
-    if not property_obj:
-        from ...core.exceptions import NotFoundError
-
-        raise NotFoundError(f"Property with ID {property_id} not found")
+    """Get units for a property with pagination and filtering.
 
-    skip = (page - 1) * page_size
+    The unit query also checks that the property exists, so the property is
+    only looked up on its own when the page comes back empty.
+    """
+    after_unit_code = decode_cursor(cursor, (str,))[0] if cursor else None
     units, total = await crud.get_units_by_property(
         db=db,
         property_id=property_id,
         account_id=current_user.account_id,
         company_id=current_user.company_id,
-        skip=skip,
-        limit=page_size,
+        skip=0 if cursor else (page - 1) * page_size,
+        limit=page_size + 1,
         status=status,
         is_leaf=is_leaf,
         parent_unit_id=parent_unit_id,
+        after_unit_code=after_unit_code,
+        with_total=cursor is None if include_total is None else include_total,
+        require_live_property=True,
     )
+    if not units and not await crud.property_exists(
+        db, property_id, current_user.account_id, current_user.company_id
+    ):
+        raise NotFoundError(f"Property with ID {property_id} not found")
+    units, next_cursor = _split_page(units, page_size, lambda u: (u.unit_code,))
 
     return BaseResponse(
         success=True,
         data=PaginatedResponse.from_items(
-            items=[UnitResponse.model_validate(u) for u in units],
+            items=[build_response(UnitResponse, u) for u in units],
             total=total,
-            page=page,
+            page=None if cursor else page,
             page_size=page_size,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -283,15 +332,6 @@ async def get_property_unit_hierarchy(
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """Get the full unit hierarchy tree for a property."""
-    # Verify property exists
-    property_obj = await crud.get_property_by_id(
-        db, property_id, current_user.account_id, current_user.company_id
-    )
-    if not property_obj:
-        from ...core.exceptions import NotFoundError
-
-        raise NotFoundError(f"Property with ID {property_id} not found")
-
     hierarchy = await services.get_unit_hierarchy(
         db=db,
         property_id=property_id,
@@ -322,8 +362,6 @@ async def get_unit(
         company_id=current_user.company_id,
     )
     if not unit:
-        from ...core.exceptions import NotFoundError
-
         raise NotFoundError(f"Unit with ID {unit_id} not found")
 
     return BaseResponse(
@@ -346,11 +384,6 @@ async def create_unit(
         data=data,
     )
 
-    # Reload to get category relationship
-    unit = await crud.get_unit_by_id(
-        db, unit.id, current_user.account_id, current_user.company_id
-    )
-
     return BaseResponse(
         success=True,
         message="Unit created successfully",
@@ -374,11 +407,6 @@ async def update_unit(
         data=data,
     )
 
-    # Reload to get category relationship
-    unit = await crud.get_unit_by_id(
-        db, unit.id, current_user.account_id, current_user.company_id
-    )
-
     return BaseResponse(
         success=True,
         message="Unit updated successfully",
@@ -421,8 +449,6 @@ async def get_unit_children(
         db, unit_id, current_user.account_id, current_user.company_id
     )
     if not unit:
-        from ...core.exceptions import NotFoundError
-
         raise NotFoundError(f"Unit with ID {unit_id} not found")
 
     # Get children
@@ -433,11 +459,12 @@ async def get_unit_children(
         company_id=current_user.company_id,
         parent_unit_id=unit_id,
         limit=1000,
+        with_total=False,
     )
 
     return BaseResponse(
         success=True,
-        data=[UnitResponse.model_validate(u) for u in children],
+        data=[build_response(UnitResponse, u) for u in children],
     )
 
 
@@ -452,30 +479,41 @@ async def get_leasable_units(
     category_id: int | None = Query(None, description="Filter by category"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: str | None = _CURSOR_QUERY,
+    include_total: bool | None = _INCLUDE_TOTAL_QUERY,
 ):
     """Get all leasable units for the leasing screen.
 
     Returns only leaf units with AVAILABLE status.
     This is the main endpoint for contract/lease creation workflows.
     """
-    skip = (page - 1) * page_size
+    after_property_id = after_unit_code = None
+    if cursor:
+        after_property_id, after_unit_code = decode_cursor(cursor, (int, str))
     units, total = await services.get_leasable_units(
         db=db,
         account_id=current_user.account_id,
         company_id=current_user.company_id,
         property_id=property_id,
         category_id=category_id,
-        skip=skip,
-        limit=page_size,
+        skip=0 if cursor else (page - 1) * page_size,
+        limit=page_size + 1,
+        after_property_id=after_property_id,
+        after_unit_code=after_unit_code,
+        with_total=cursor is None if include_total is None else include_total,
+    )
+    units, next_cursor = _split_page(
+        units, page_size, lambda u: (u.property_id, u.unit_code)
     )
 
     return BaseResponse(
         success=True,
         data=PaginatedResponse.from_items(
-            items=[UnitResponse.model_validate(u) for u in units],
+            items=[build_response(UnitResponse, u) for u in units],
             total=total,
-            page=page,
+            page=None if cursor else page,
             page_size=page_size,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -490,6 +528,8 @@ async def get_units_for_leasing(
     category_id: int | None = Query(None, description="Filter by category"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: str | None = _CURSOR_QUERY,
+    include_total: bool | None = _INCLUDE_TOTAL_QUERY,
 ):
     """Get leasable units for the leasing screen with enhanced response.
 
@@ -497,15 +537,23 @@ async def get_units_for_leasing(
     Includes nested property/category and computed full_path breadcrumb.
     This is the recommended endpoint for the leasing/contract creation UI.
     """
-    skip = (page - 1) * page_size
+    after_property_id = after_unit_code = None
+    if cursor:
+        after_property_id, after_unit_code = decode_cursor(cursor, (int, str))
     units, total = await services.get_leasable_units_for_leasing(
         db=db,
         account_id=current_user.account_id,
         company_id=current_user.company_id,
         property_id=property_id,
         category_id=category_id,
-        skip=skip,
-        limit=page_size,
+        skip=0 if cursor else (page - 1) * page_size,
+        limit=page_size + 1,
+        after_property_id=after_property_id,
+        after_unit_code=after_unit_code,
+        with_total=cursor is None if include_total is None else include_total,
+    )
+    units, next_cursor = _split_page(
+        units, page_size, lambda u: (u.property.id, u.unit_code)
     )
 
     return BaseResponse(
@@ -513,8 +561,9 @@ async def get_units_for_leasing(
         data=PaginatedResponse.from_items(
             items=units,
             total=total,
-            page=page,
+            page=None if cursor else page,
             page_size=page_size,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -531,21 +580,14 @@ async def get_property_leaf_units(
     category_id: int | None = Query(None, description="Filter by category"),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
+    cursor: str | None = _CURSOR_QUERY,
+    include_total: bool | None = _INCLUDE_TOTAL_QUERY,
 ):
     """Get all leaf units (rentable) for a specific property.
 
     Returns only units with is_leaf=True.
     """
-    # Verify property exists
-    property_obj = await crud.get_property_by_id(
-        db, property_id, current_user.account_id, current_user.company_id
-    )
-    if not property_obj:
-        from ...core.exceptions import NotFoundError
-
-        raise NotFoundError(f"Property with ID {property_id} not found")
-
-    skip = (page - 1) * page_size
+    after_unit_code = decode_cursor(cursor, (str,))[0] if cursor else None
     units, total = await services.get_leaf_units_by_property(
         db=db,
         property_id=property_id,
@@ -553,16 +595,20 @@ async def get_property_leaf_units(
         company_id=current_user.company_id,
         status=status,
         category_id=category_id,
-        skip=skip,
-        limit=page_size,
+        skip=0 if cursor else (page - 1) * page_size,
+        limit=page_size + 1,
+        after_unit_code=after_unit_code,
+        with_total=cursor is None if include_total is None else include_total,
     )
+    units, next_cursor = _split_page(units, page_size, lambda u: (u.unit_code,))
 
     return BaseResponse(
         success=True,
         data=PaginatedResponse.from_items(
-            items=[UnitResponse.model_validate(u) for u in units],
+            items=[build_response(UnitResponse, u) for u in units],
             total=total,
-            page=page,
+            page=None if cursor else page,
             page_size=page_size,
+            next_cursor=next_cursor,
         ),
     )
@@ -4,12 +4,17 @@ Per EP-01 specification.
 """
 
 from datetime import datetime
+from functools import cache
+from types import UnionType
+from typing import Any, TypeVar, get_args
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .models import PropertyStatus, PropertyUsageType, UnitStatus
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 # ----- Unit Category Schemas -----
 
 
@@ -49,8 +54,7 @@ class UnitCategoryResponse(UnitCategoryBase):
     id: int
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Property Schemas -----
@@ -115,8 +119,7 @@ class PropertyResponse(PropertyBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PropertyWithUnitsResponse(PropertyResponse):
@@ -183,8 +186,7 @@ class UnitResponse(UnitBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UnitWithChildrenResponse(UnitResponse):
@@ -205,8 +207,7 @@ class UnitHierarchyResponse(BaseModel):
     status: UnitStatus
     children: list["UnitHierarchyResponse"] = []
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Leasing Screen Schemas -----
@@ -221,8 +222,7 @@ class PropertySummary(BaseModel):
     property_name: str
     usage_type: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategorySummary(BaseModel):
@@ -234,8 +234,7 @@ class CategorySummary(BaseModel):
     is_residential: bool
     is_commercial: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LeafUnitResponse(BaseModel):
@@ -258,11 +257,52 @@ class LeafUnitResponse(BaseModel):
     floor_number: str | None = None
     room_number: str | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Update forward references
 PropertyWithUnitsResponse.model_rebuild()
 UnitWithChildrenResponse.model_rebuild()
 UnitHierarchyResponse.model_rebuild()
+
+
+# ----- Response Building -----
+
+
+@cache
+def _response_fields(
+    model_cls: type[BaseModel],
+) -> tuple[tuple[str, type[BaseModel] | None], ...]:
+    """Field names of a response schema, with the schema of nested model fields."""
+    fields = []
+    for name, field in model_cls.model_fields.items():
+        annotation = field.annotation
+        if isinstance(annotation, UnionType):
+            annotation = next(
+                (arg for arg in get_args(annotation) if arg is not type(None)), None
+            )
+        nested = (
+            annotation
+            if isinstance(annotation, type) and issubclass(annotation, BaseModel)
+            else None
+        )
+        fields.append((name, nested))
+    return tuple(fields)
+
+
+def build_response(model_cls: type[ModelT], obj: Any) -> ModelT:
+    """Build a response schema from a loaded ORM object without validating it.
+
+    Input is validated on the way in (PropertyCreate, UnitCreate, ...) and the
+    column types already match the response fields, so list endpoints skip
+    model_validate and copy the attributes across with model_construct.
+    Nested schema fields (e.g. a unit's category) are built the same way.
+    Single-object create/update responses keep using model_validate.
+    """
+    values = {}
+    for name, nested in _response_fields(model_cls):
+        value = getattr(obj, name)
+        if nested is not None and value is not None:
+            value = build_response(nested, value)
+        values[name] = value
+    return model_cls.model_construct(**values)
@@ -3,11 +3,10 @@
 Contains initial data for unit categories.
 """
 
-import json
-
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .crud import clear_unit_category_cache
 from .models import UnitCategory
 
 # Unit category seed data with hierarchy rules
@@ -28,7 +27,7 @@ UNIT_CATEGORY_SEED_DATA = [
         "description": "A room within an apartment or property",
         "is_residential": True,
         "is_commercial": False,
-        "allowed_parent_categories": json.dumps(["APARTMENT"]),
+        "allowed_parent_categories": '["APARTMENT"]',
         "max_depth": 2,
     },
     {
@@ -37,7 +36,7 @@ UNIT_CATEGORY_SEED_DATA = [
         "description": "An individual bed space within a room",
         "is_residential": True,
         "is_commercial": False,
-        "allowed_parent_categories": json.dumps(["ROOM"]),
+        "allowed_parent_categories": '["ROOM"]',
         "max_depth": 3,
     },
     # Commercial categories
@@ -84,7 +83,7 @@ UNIT_CATEGORY_SEED_DATA = [
         "description": "A floor within a parking structure",
         "is_residential": False,
         "is_commercial": True,
-        "allowed_parent_categories": json.dumps(["PARKING"]),
+        "allowed_parent_categories": '["PARKING"]',
         "max_depth": 2,
     },
     {
@@ -93,7 +92,7 @@ UNIT_CATEGORY_SEED_DATA = [
         "description": "An individual parking space",
         "is_residential": False,
         "is_commercial": True,
-        "allowed_parent_categories": json.dumps(["PARKING_FLOOR"]),
+        "allowed_parent_categories": '["PARKING_FLOOR"]',
         "max_depth": 3,
     },
 ]
@@ -108,16 +107,18 @@ async def seed_unit_categories(db: AsyncSession) -> int:
     Returns:
         Number of categories created (0 if already seeded)
     """
-    # Check if categories already exist
-    result = await db.execute(select(UnitCategory).limit(1))
-    if result.scalar_one_or_none() is not None:
+    # Check if categories already exist; EXISTS stops at the first row
+    result = await db.execute(select(select(UnitCategory.id).exists()))
+    if result.scalar():
         return 0  # Already seeded
 
-    created_count = 0
-    for category_data in UNIT_CATEGORY_SEED_DATA:
-        category = UnitCategory(**category_data, is_active=True)
-        db.add(category)
-        created_count += 1
-
-    await db.flush()
-    return created_count
+    # One executemany-style INSERT instead of a flush of N ORM objects
+    await db.execute(
+        insert(UnitCategory),
+        [
+            {**category_data, "is_active": True}
+            for category_data in UNIT_CATEGORY_SEED_DATA
+        ],
+    )
+    clear_unit_category_cache()
+    return len(UNIT_CATEGORY_SEED_DATA)
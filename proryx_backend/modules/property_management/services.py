@@ -10,9 +10,11 @@ from .models import Property, Unit, UnitCategory
 from .schemas import (
     PropertyCreate,
     PropertyUpdate,
+    UnitCategoryResponse,
     UnitCreate,
     UnitHierarchyResponse,
     UnitUpdate,
+    build_response,
 )
 
 # Maximum allowed hierarchy depth for units
@@ -27,6 +29,8 @@ async def _get_unit_depth(
 ) -> int:
     """Calculate the depth of a unit by traversing up the parent chain.
 
+    The whole chain is fetched in one query and walked in memory.
+
     Args:
         db: Database session
         unit_id: The unit ID to calculate depth for (None = root level)
@@ -39,12 +43,14 @@ async def _get_unit_depth(
     if unit_id is None:
         return 0  # No parent means this will be at depth 1
 
+    chain = await crud.get_unit_ancestors(db, {unit_id}, account_id, company_id)
+
     depth = 0
     current_id = unit_id
 
     while current_id is not None:
         depth += 1
-        unit = await crud.get_unit_by_id(db, current_id, account_id, company_id)
+        unit = chain.get(current_id)
         if unit is None:
             break
         current_id = unit.parent_unit_id
@@ -216,24 +222,25 @@ async def delete_property(
         NotFoundError: If property not found
         ValidationError: If property has active units
     """
+    # The active-units check is folded into the UPDATE; only work out why
+    # nothing was updated when the delete is refused
+    if await crud.soft_delete_property(db, property_id, account_id, company_id):
+        await db.commit()
+        return
+
     property_obj = await crud.get_property_by_id(
         db, property_id, account_id, company_id
     )
     if not property_obj:
         raise NotFoundError(f"Property with ID {property_id} not found")
 
-    # Check for active units
     active_units_count = await crud.get_active_units_count(
         db, property_id, account_id, company_id
     )
-    if active_units_count > 0:
-        raise ValidationError(
-            f"Cannot delete property with {active_units_count} active unit(s). "
-            "Deactivate all units first."
-        )
-
-    await crud.soft_delete_property(db, property_obj)
-    await db.commit()
+    raise ValidationError(
+        f"Cannot delete property with {active_units_count} active unit(s). "
+        "Deactivate all units first."
+    )
 
 
 async def create_unit(
@@ -424,15 +431,19 @@ async def delete_unit(
         NotFoundError: If unit not found
         ValidationError: If unit has children
     """
-    unit = await crud.get_unit_by_id(db, unit_id, account_id, company_id)
-    if not unit:
-        raise NotFoundError(f"Unit with ID {unit_id} not found")
-
-    # Check if unit has children
-    children_count = await crud.get_unit_children_count(
+    # Fetch the unit and check for children in one query
+    found = await crud.get_unit_with_has_children(
         db, unit_id, account_id, company_id
     )
-    if children_count > 0:
+    if not found:
+        raise NotFoundError(f"Unit with ID {unit_id} not found")
+
+    unit, has_children = found
+    if has_children:
+        # Only count the children when the delete is refused
+        children_count = await crud.get_unit_children_count(
+            db, unit_id, account_id, company_id
+        )
         raise ValidationError(
             f"Cannot delete unit with {children_count} child unit(s). "
             "Delete children first."
@@ -443,12 +454,12 @@ async def delete_unit(
 
     # Recompute is_leaf for parent if exists
     if parent_id:
-        parent = await crud.get_unit_by_id(db, parent_id, account_id, company_id)
-        if parent:
-            children_count = await crud.get_unit_children_count(
-                db, parent_id, account_id, company_id
-            )
-            if children_count == 0 and not parent.is_leaf:
+        found = await crud.get_unit_with_has_children(
+            db, parent_id, account_id, company_id
+        )
+        if found:
+            parent, has_children = found
+            if not has_children and not parent.is_leaf:
                 await crud.update_unit(db, parent, is_leaf=True)
 
     await db.commit()
@@ -461,10 +472,9 @@ async def _recompute_is_leaf(
     unit: Unit,
 ) -> None:
     """Recompute is_leaf for a unit based on its children."""
-    children_count = await crud.get_unit_children_count(
+    expected_is_leaf = not await crud.has_unit_children(
         db, unit.id, account_id, company_id
     )
-    expected_is_leaf = children_count == 0
     if unit.is_leaf != expected_is_leaf:
         await crud.update_unit(db, unit, is_leaf=expected_is_leaf)
 
@@ -477,14 +487,30 @@ async def get_unit_hierarchy(
 ) -> list[UnitHierarchyResponse]:
     """Get the full unit hierarchy for a property.
 
-    Returns a tree structure starting from root units.
+    Returns a tree structure starting from root units. All units come from
+    one query (categories from the category cache) and the tree is built in
+    memory.
+
+    Raises:
+        NotFoundError: If the property doesn't exist
     """
-    # Get all units for the property
+    # Get all units for the property, already in unit_code order; the query
+    # also checks the property, so only an empty result needs a lookup
     all_units, _ = await crud.get_units_by_property(
-        db, property_id, account_id, company_id, limit=10000
+        db,
+        property_id,
+        account_id,
+        company_id,
+        limit=10000,
+        with_total=False,
+        require_live_property=True,
     )
+    if not all_units and not await crud.property_exists(
+        db, property_id, account_id, company_id
+    ):
+        raise NotFoundError(f"Property with ID {property_id} not found")
 
-    # Build children lookup
+    # Build children lookup; appending keeps each sibling list in order
     children_by_parent: dict[int | None, list[Unit]] = {}
     for unit in all_units:
         parent_id = unit.parent_unit_id
@@ -492,22 +518,26 @@ async def get_unit_hierarchy(
             children_by_parent[parent_id] = []
         children_by_parent[parent_id].append(unit)
 
+    # A property has many units but few categories; build each response once
+    category_responses: dict[int, UnitCategoryResponse] = {}
+
+    def category_response(category: UnitCategory) -> UnitCategoryResponse:
+        response = category_responses.get(category.id)
+        if response is None:
+            response = build_response(UnitCategoryResponse, category)
+            category_responses[category.id] = response
+        return response
+
     def build_tree(parent_id: int | None) -> list[UnitHierarchyResponse]:
         children = children_by_parent.get(parent_id, [])
         result = []
-        for unit in sorted(children, key=lambda u: u.unit_code):
-            from .schemas import UnitCategoryResponse
-
+        for unit in children:
             node = UnitHierarchyResponse(
                 id=unit.id,
                 uuid=unit.uuid,
                 unit_code=unit.unit_code,
                 display_name=unit.display_name,
-                category=(
-                    UnitCategoryResponse.model_validate(unit.category)
-                    if unit.category
-                    else None
-                ),
+                category=category_response(unit.category) if unit.category else None,
                 is_leaf=unit.is_leaf,
                 status=unit.status,
                 children=build_tree(unit.id),
@@ -526,7 +556,10 @@ async def get_leasable_units(
     category_id: int | None = None,
     skip: int = 0,
     limit: int = 100,
-) -> tuple[list[Unit], int]:
+    after_property_id: int | None = None,
+    after_unit_code: str | None = None,
+    with_total: bool = True,
+) -> tuple[list[Unit], int | None]:
     """Get all leasable units for the leasing screen.
 
     Returns only leaf units with AVAILABLE status.
@@ -540,6 +573,9 @@ async def get_leasable_units(
         category_id: Optional category filter
         skip: Pagination offset
         limit: Pagination limit
+        after_property_id: Property ID of the previous page's last unit
+        after_unit_code: Unit code of the previous page's last unit
+        with_total: Whether to count all matches; the total is None if not
 
     Returns:
         Tuple of (list of leasable units, total count)
@@ -552,6 +588,9 @@ async def get_leasable_units(
         category_id=category_id,
         skip=skip,
         limit=limit,
+        after_property_id=after_property_id,
+        after_unit_code=after_unit_code,
+        with_total=with_total,
     )
 
 
@@ -564,7 +603,9 @@ async def get_leaf_units_by_property(
     category_id: int | None = None,
     skip: int = 0,
     limit: int = 100,
-) -> tuple[list[Unit], int]:
+    after_unit_code: str | None = None,
+    with_total: bool = True,
+) -> tuple[list[Unit], int | None]:
     """Get all leaf units (rentable) for a specific property.
 
     Args:
@@ -576,9 +617,14 @@ async def get_leaf_units_by_property(
         category_id: Optional category filter
         skip: Pagination offset
         limit: Pagination limit
+        after_unit_code: Unit code of the previous page's last unit
+        with_total: Whether to count all matches; the total is None if not
 
     Returns:
         Tuple of (list of leaf units, total count)
+
+    Raises:
+        NotFoundError: If the property doesn't exist
     """
     from .models import UnitStatus
 
@@ -589,7 +635,8 @@ async def get_leaf_units_by_property(
         except ValueError:
             pass  # Invalid status, ignore filter
 
-    return await crud.get_leaf_units(
+    # The query also checks the property, so only an empty page needs a lookup
+    units, total = await crud.get_leaf_units(
         db=db,
         property_id=property_id,
         account_id=account_id,
@@ -598,17 +645,23 @@ async def get_leaf_units_by_property(
         category_id=category_id,
         skip=skip,
         limit=limit,
+        after_unit_code=after_unit_code,
+        with_total=with_total,
+        require_live_property=True,
     )
+    if not units and not await crud.property_exists(
+        db, property_id, account_id, company_id
+    ):
+        raise NotFoundError(f"Property with ID {property_id} not found")
+    return units, total
 
 
-async def _compute_unit_full_path(
-    db: AsyncSession,
-    unit: "Unit",
-    account_id: int,
-    company_id: int,
-) -> str:
+def _compute_unit_full_path(unit: "Unit", ancestors: dict) -> str:
     """Compute the full breadcrumb path for a unit.
 
+    `ancestors` maps unit ID to its parent row, as returned by
+    crud.get_unit_ancestors().
+
     Returns a string like: "Property Name → Parent Unit → Child Unit → This Unit"
     """
     path_parts = []
@@ -619,14 +672,16 @@ async def _compute_unit_full_path(
     # Traverse up the parent chain
     current_parent_id = unit.parent_unit_id
     while current_parent_id is not None:
-        parent = await crud.get_unit_by_id(
-            db, current_parent_id, account_id, company_id
-        )
+        parent = ancestors.get(current_parent_id)
         if parent is None:
             break
         path_parts.append(parent.display_name or parent.unit_code)
         current_parent_id = parent.parent_unit_id
 
+        # Safety check to prevent infinite loops
+        if len(path_parts) > MAX_UNIT_DEPTH + 1:
+            break
+
     # Add property name at the beginning
     if unit.property:
         path_parts.append(unit.property.property_name)
@@ -645,7 +700,10 @@ async def get_leasable_units_for_leasing(
     category_id: int | None = None,
     skip: int = 0,
     limit: int = 50,
-) -> tuple[list[dict], int]:
+    after_property_id: int | None = None,
+    after_unit_code: str | None = None,
+    with_total: bool = True,
+) -> tuple[list[dict], int | None]:
     """Get leasable units with enhanced response for leasing screen.
 
     Returns leaf units with AVAILABLE status, including:
@@ -661,6 +719,9 @@ async def get_leasable_units_for_leasing(
         category_id: Optional category filter
         skip: Pagination offset
         limit: Pagination limit
+        after_property_id: Property ID of the previous page's last unit
+        after_unit_code: Unit code of the previous page's last unit
+        with_total: Whether to count all matches; the total is None if not
 
     Returns:
         Tuple of (list of LeafUnitResponse dicts, total count)
@@ -676,12 +737,23 @@ async def get_leasable_units_for_leasing(
         category_id=category_id,
         skip=skip,
         limit=limit,
+        after_property_id=after_property_id,
+        after_unit_code=after_unit_code,
+        with_total=with_total,
+    )
+
+    # Every parent chain on the page in one query
+    ancestors = await crud.get_unit_ancestors(
+        db,
+        {unit.parent_unit_id for unit in units if unit.parent_unit_id is not None},
+        account_id,
+        company_id,
     )
 
     # Transform to LeafUnitResponse with computed full_path
     result = []
     for unit in units:
-        full_path = await _compute_unit_full_path(db, unit, account_id, company_id)
+        full_path = _compute_unit_full_path(unit, ancestors)
 
         leaf_response = LeafUnitResponse(
             id=unit.id,
@@ -705,7 +777,7 @@ async def get_leasable_units_for_leasing(
             ),
             status=unit.status,
             capacity=unit.capacity,
-            area_sqm=float(unit.area_sqm) if unit.area_sqm else None,
+            area_sqm=unit.area_sqm,
             floor_number=unit.floor_number,
             room_number=unit.room_number,
         )
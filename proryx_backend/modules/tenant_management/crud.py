@@ -186,23 +186,9 @@ async def create_tenant(
     **kwargs,
 ) -> Tenant:
     """Create a new tenant."""
-    import uuid
-
-    # Get next ID for this tenant scope
-    result = await db.execute(
-        select(Tenant.id)
-        .where(and_(Tenant.account_id == account_id, Tenant.company_id == company_id))
-        .order_by(Tenant.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
-
     tenant = Tenant(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         tenant_code=tenant_code,
         tenant_type=tenant_type,
         kyc_status=KYCStatus.PENDING,
@@ -299,28 +285,9 @@ async def create_contact(
     **kwargs,
 ) -> TenantContact:
     """Create a new tenant contact."""
-    import uuid
-
-    # Get next ID for this tenant scope
-    result = await db.execute(
-        select(TenantContact.id)
-        .where(
-            and_(
-                TenantContact.account_id == account_id,
-                TenantContact.company_id == company_id,
-            )
-        )
-        .order_by(TenantContact.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
-
     contact = TenantContact(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         tenant_id=tenant_id,
         contact_name=contact_name,
         **kwargs,
@@ -416,28 +383,9 @@ async def create_document(
     **kwargs,
 ) -> TenantDocument:
     """Create a new tenant document."""
-    import uuid
-
-    # Get next ID for this tenant scope
-    result = await db.execute(
-        select(TenantDocument.id)
-        .where(
-            and_(
-                TenantDocument.account_id == account_id,
-                TenantDocument.company_id == company_id,
-            )
-        )
-        .order_by(TenantDocument.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
-
     document = TenantDocument(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         tenant_id=tenant_id,
         document_type_id=document_type_id,
         verification_status=DocumentVerificationStatus.PENDING,
@@ -371,8 +371,12 @@ class TenantDocument(AccountScoped, TimestampMixin, Base):
     @property
     def is_expired(self) -> bool:
         """Check if document is expired."""
+        return self.expired_as_of(date.today())
+
+    def expired_as_of(self, today: date) -> bool:
+        """Check if document is expired on ``today``."""
         if self.expiry_date:
-            return date.today() > self.expiry_date
+            return today > self.expiry_date
         return False
 
     def __repr__(self) -> str:
@@ -6,7 +6,7 @@ Per EP-03 specification.
 from datetime import date, datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .models import (
     ContactStatus,
@@ -46,8 +46,7 @@ class DocumentTypeResponse(DocumentTypeBase):
     id: int
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Tenant Schemas -----
@@ -184,8 +183,7 @@ class TenantResponse(TenantBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TenantSummary(BaseModel):
@@ -200,8 +198,7 @@ class TenantSummary(BaseModel):
     kyc_status: KYCStatus
     status: TenantStatus
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class TenantWithDetails(TenantResponse):
@@ -257,8 +254,7 @@ class TenantContactResponse(TenantContactBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Tenant Document Schemas -----
@@ -315,8 +311,7 @@ class TenantDocumentResponse(TenantDocumentBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Verification Schemas -----
@@ -1,5 +1,7 @@
 """Tenant management business logic services."""
 
+from datetime import date
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.exceptions import NotFoundError, ValidationError
@@ -205,6 +207,7 @@ async def derive_kyc_status(
     has_rejected = False
     has_expired = False
     has_pending_or_in_progress = False
+    today = date.today()
 
     for type_id in mandatory_types:
         type_docs = docs_by_type.get(type_id, [])
@@ -222,7 +225,7 @@ async def derive_kyc_status(
             all_verified = False
             has_pending_or_in_progress = True
         elif latest_doc.verification_status == DocumentVerificationStatus.VERIFIED:
-            if latest_doc.is_expired:
+            if latest_doc.expired_as_of(today):
                 has_expired = True
                 all_verified = False
         elif latest_doc.verification_status == DocumentVerificationStatus.EXPIRED:
@@ -118,23 +118,9 @@ async def create_vendor(
     **kwargs,
 ) -> Vendor:
     """Create a new vendor."""
-    import uuid
-
-    # Get next ID for this tenant
-    result = await db.execute(
-        select(Vendor.id)
-        .where(and_(Vendor.account_id == account_id, Vendor.company_id == company_id))
-        .order_by(Vendor.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
-
     vendor = Vendor(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         vendor_code=vendor_code,
         name=name,
         vendor_type=vendor_type,
@@ -271,28 +257,9 @@ async def create_lease(
     **kwargs,
 ) -> VendorLease:
     """Create a new vendor lease."""
-    import uuid
-
-    # Get next ID for this tenant
-    result = await db.execute(
-        select(VendorLease.id)
-        .where(
-            and_(
-                VendorLease.account_id == account_id,
-                VendorLease.company_id == company_id,
-            )
-        )
-        .order_by(VendorLease.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
-
     lease = VendorLease(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         vendor_id=vendor_id,
         lease_code=lease_code,
         start_date=start_date,
@@ -377,28 +344,9 @@ async def create_lease_term(
     reason: str | None = None,
 ) -> VendorLeaseTerm:
     """Create a new lease term."""
-    import uuid
-
-    # Get next ID for this tenant
-    result = await db.execute(
-        select(VendorLeaseTerm.id)
-        .where(
-            and_(
-                VendorLeaseTerm.account_id == account_id,
-                VendorLeaseTerm.company_id == company_id,
-            )
-        )
-        .order_by(VendorLeaseTerm.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
-
     term = VendorLeaseTerm(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         lease_id=lease_id,
         term_number=term_number,
         start_date=start_date,
@@ -443,28 +391,9 @@ async def create_lease_coverage(
     unit_id: int | None = None,
 ) -> VendorLeaseCoverage:
     """Create a new lease coverage entry."""
-    import uuid
-
-    # Get next ID for this tenant
-    result = await db.execute(
-        select(VendorLeaseCoverage.id)
-        .where(
-            and_(
-                VendorLeaseCoverage.account_id == account_id,
-                VendorLeaseCoverage.company_id == company_id,
-            )
-        )
-        .order_by(VendorLeaseCoverage.id.desc())
-        .limit(1)
-    )
-    max_id = result.scalar_one_or_none()
-    next_id = (max_id or 0) + 1
-
     coverage = VendorLeaseCoverage(
         account_id=account_id,
         company_id=company_id,
-        id=next_id,
-        uuid=str(uuid.uuid4()),
         lease_id=lease_id,
         scope_type=scope_type,
         property_id=property_id,
@@ -7,7 +7,7 @@ from datetime import date, datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .models import (
     BillingCycle,
@@ -92,8 +92,7 @@ class VendorResponse(VendorBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VendorSummary(BaseModel):
@@ -107,8 +106,7 @@ class VendorSummary(BaseModel):
     active_leases_count: int = 0
     status: VendorStatus
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Vendor Lease Schemas -----
@@ -188,8 +186,7 @@ class VendorLeaseResponse(VendorLeaseBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class VendorLeaseWithDetails(VendorLeaseResponse):
@@ -245,8 +242,7 @@ class VendorLeaseTermResponse(VendorLeaseTermBase):
     created_at: datetime
     updated_at: datetime | None = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Vendor Lease Coverage Schemas -----
@@ -286,8 +282,7 @@ class VendorLeaseCoverageResponse(VendorLeaseCoverageBase):
     lease_id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ----- Action Schemas -----
@@ -11,11 +11,13 @@ CONFIG_FILE="${CONFIG:-resources/config/local.yaml}"
 case "$1" in
     "start" | "")
         echo "Starting ProRyx backend server..."
-        CONFIG=$CONFIG_FILE uv run uvicorn proryx_backend.main:app --host 0.0.0.0 --port 8000 --reload
+        CONFIG=$CONFIG_FILE uv run uvicorn proryx_backend.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --no-access-log --reload
         ;;
     "start-prod")
         echo "Starting ProRyx in production mode..."
-        CONFIG=resources/config/prod.yaml uv run uvicorn proryx_backend.main:app --host 0.0.0.0 --port 8000
+        # uvicorn reads the worker count from WEB_CONCURRENCY; the workers use it
+        # to size their share of the DB connections
+        CONFIG=resources/config/prod.yaml WEB_CONCURRENCY="$(nproc)" uv run uvicorn proryx_backend.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --no-access-log
         ;;
     "test")
         echo "Running tests..."
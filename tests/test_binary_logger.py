@@ -0,0 +1,129 @@
+"""Round-trip tests for the binary request log."""
+
+import logging
+
+from proryx_backend.core.logging.binary_logger import BinaryRequestLogHandler, inflate
+
+
+def _record(msg: str, created: float, **extra) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "proryx_backend.requests", logging.INFO, __file__, 0, msg, None, None
+    )
+    record.created = created
+    record.__dict__.update(extra)
+    return record
+
+
+def test_records_inflate_to_what_was_logged(tmp_path):
+    path = tmp_path / "requests.bin"
+    handler = BinaryRequestLogHandler(str(path))
+    handler.emit(
+        _record(
+            "Request started",
+            1_700_000_000.5,
+            transaction_id="ab12cd34",
+            method="POST",
+            path="/api/properties/ünits",
+        )
+    )
+    handler.emit(
+        _record(
+            "Request completed",
+            1_700_000_000.75,
+            transaction_id="ab12cd34",
+            status_code=201,
+            duration_ms=12.34,
+        )
+    )
+    handler.emit(
+        _record(
+            "Request failed",
+            1_700_000_001.0,
+            transaction_id="ef56ab78",
+            duration_ms=3.5,
+        )
+    )
+    # Anything other than the request log sites is dropped
+    handler.emit(_record("Something else", 1_700_000_002.0))
+    handler.close()
+
+    entries = list(inflate(str(path)))
+    # Timestamps go through float seconds, so allow for rounding below 1 µs
+    timestamps = [entry.pop("timestamp_ns") for entry in entries]
+    expected_timestamps = [
+        1_700_000_000_500_000_000,
+        1_700_000_000_750_000_000,
+        1_700_000_001_000_000_000,
+    ]
+    assert len(timestamps) == len(expected_timestamps)
+    for ts, expected in zip(timestamps, expected_timestamps):
+        assert abs(ts - expected) < 1_000
+    assert entries == [
+        {
+            "message": "Request started",
+            "transaction_id": "ab12cd34",
+            "method": "POST",
+            "path": "/api/properties/ünits",
+        },
+        {
+            "message": "Request completed",
+            "transaction_id": "ab12cd34",
+            "status_code": 201,
+            "duration_ms": 12.34,
+        },
+        {
+            "message": "Request failed",
+            "transaction_id": "ef56ab78",
+            "status_code": 500,
+            "duration_ms": 3.5,
+        },
+    ]
+
+
+def test_unknown_methods_and_short_transaction_ids(tmp_path):
+    path = tmp_path / "requests.bin"
+    handler = BinaryRequestLogHandler(str(path))
+    handler.emit(
+        _record(
+            "Request started",
+            1_700_000_000.0,
+            transaction_id="abc",
+            method="PROPFIND",
+            path="/",
+        )
+    )
+    handler.close()
+
+    (entry,) = inflate(str(path))
+    assert entry["method"] == "OTHER"
+    assert entry["transaction_id"] == "abc"
+
+
+def test_client_supplied_transaction_ids_are_kept_whole(tmp_path):
+    # RequestIdMiddleware logs whatever x-transaction-id the client sent
+    path = tmp_path / "requests.bin"
+    handler = BinaryRequestLogHandler(str(path))
+    handler.emit(
+        _record(
+            "Request started",
+            1_700_000_000.0,
+            transaction_id="0123456789abcdef-gateway",
+            method="GET",
+            path="/",
+        )
+    )
+    handler.emit(
+        _record(
+            "Request completed",
+            1_700_000_000.0,
+            transaction_id="req-\xe9t\xe9",
+            status_code=200,
+            duration_ms=1.0,
+        )
+    )
+    handler.close()
+
+    started, completed = inflate(str(path))
+    assert started["transaction_id"] == "0123456789abcdef-gateway"
+    assert completed["transaction_id"] == "req-\xe9t\xe9"
+    assert completed["status_code"] == 200